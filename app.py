@@ -6,7 +6,7 @@
 
 import streamlit as st
 import pandas as pd
-from src import RegionalLifeSimulator, REGION_CONFIG
+from src import RegionalLifeSimulator, REGION_CONFIG, score_points
 
 # 地域別の設定
 REGION_DISPLAY = {
@@ -304,7 +304,7 @@ if st.session_state.lives:
             # 親ガチャスコアを表示
             if show_parent_gacha:
                 parent_gacha_result = simulator.calculate_parent_gacha_score(life)
-                pg_score = int(parent_gacha_result['total_score'])
+                pg_score = score_points(parent_gacha_result['total_score'])
                 pg_rank = parent_gacha_result.get('rank', 'B')
                 pg_rank_label = parent_gacha_result.get('rank_label', '普通')
                 
@@ -346,7 +346,7 @@ if st.session_state.lives:
             # 人生スコアを表示
             if show_score:
                 score_result = simulator.calculate_life_score(life)
-                total_score = int(score_result['total_score'])
+                total_score = score_points(score_result['total_score'])
                 life_rank = score_result.get('rank', 'B')
                 life_rank_label = score_result.get('rank_label', '普通')
                 
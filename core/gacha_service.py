@@ -17,7 +17,6 @@ if str(_base_path) not in sys.path:
     sys.path.insert(0, str(_base_path))
 
 from src import RegionalLifeSimulator, REGION_CONFIG
-from src.correlation_visualizer import create_correlation_sankey, get_correlation_summary
 
 
 @dataclass
@@ -120,10 +119,13 @@ class GachaService:
         Returns:
             LifeResult: 人生シミュレーション結果
         """
-        life = self._simulator.generate_life()
+        return self._build_result(self._simulator.generate_life())
+    
+    def _build_result(self, life: Dict[str, Any]) -> LifeResult:
+        """人生データからスコア・ストーリーを計算してLifeResultを作成"""
         score_result = self._simulator.calculate_life_score(life)
         parent_gacha_result = self._simulator.calculate_parent_gacha_score(life)
-        life_story = self._generate_life_story(life)
+        life_story = self._generate_life_story(life, score_result)
         parent_rank = self._calculate_parent_rank(life)
         
         return LifeResult(
@@ -144,10 +146,14 @@ class GachaService:
         Returns:
             LifeResultのリスト
         """
-        return [self.generate_life() for _ in range(count)]
+        return [self._build_result(life) for life in self._simulator.generate_lives(count)]
     
-    def _generate_life_story(self, life: Dict[str, Any]) -> str:
-        """人生データからストーリーテキストを生成"""
+    def _generate_life_story(
+        self,
+        life: Dict[str, Any],
+        score_result: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """人生データからストーリーテキストを生成（score_resultがあれば生涯年収を再計算しない）"""
         lines = []
         
         # 出生
@@ -203,8 +209,9 @@ class GachaService:
         retirement_age = life.get('retirement_age')
         
         # 生涯年収を計算（スコアから取得、万円単位）
-        score_result = self._simulator.calculate_life_score(life)
-        lifetime_income = score_result.get('breakdown', {}).get('lifetime_income', {}).get('raw_value', 0)
+        if score_result is None:
+            score_result = self._simulator.calculate_life_score(life, verbose=False)
+        lifetime_income = score_result['derived']['lifetime_income']
         # 万円 → 億円 に変換（10000万円 = 1億円）
         income_oku = lifetime_income / 10000 if lifetime_income else 0
         
@@ -272,11 +279,14 @@ class GachaService:
     @staticmethod
     def get_correlation_summary() -> Dict[str, int]:
         """相関図のサマリー情報を取得"""
+        # plotlyの読み込みは相関図を使うときまで遅らせる
+        from src.correlation_visualizer import get_correlation_summary
         return get_correlation_summary()
     
     @staticmethod
     def create_correlation_figure():
         """相関図（Plotly Figure）を作成"""
+        from src.correlation_visualizer import create_correlation_sankey
         return create_correlation_sankey()
     
     @staticmethod
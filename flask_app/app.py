@@ -15,6 +15,7 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 from core import GachaService, get_gacha_service
+from src import score_points
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'jinsei-gacha-secret-key-2026')
@@ -178,6 +179,10 @@ def api_rates():
 def format_edu_filter(s):
     return format_education(s)
 
+@app.template_filter('score_points')
+def score_points_filter(score):
+    return score_points(score)
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=True)
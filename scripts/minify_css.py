@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Streamlit版のカスタムCSSを最小化するスクリプト
+
+assets/app.css（編集用のソース）からコメントと余分な空白を取り除き、
+assets/app.min.css（streamlit_app.py が読み込むファイル）を生成します。
+
+使用方法:
+    python scripts/minify_css.py
+"""
+
+import re
+import sys
+from pathlib import Path
+
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+SOURCE_FILE = ASSETS_DIR / "app.css"
+OUTPUT_FILE = ASSETS_DIR / "app.min.css"
+
+# 文字列リテラル・コメント・それ以外を順に切り出す
+_TOKEN_PATTERN = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|(/\*.*?\*/)|([^"\'/]+|/)', re.S)
+# 前後の空白を詰めてよい記号（セレクタの子孫結合子となる空白は残す）
+_PUNCTUATION_SPACE = re.compile(r'\s*([{};,>])\s*')
+# 値の前のコロン直後の空白（セレクタの疑似クラスでは空白が入らない）
+_COLON_SPACE = re.compile(r':\s+')
+
+
+def minify_css(css):
+    """
+    CSS文字列を最小化
+
+    Args:
+        css: 元のCSS文字列
+
+    Returns:
+        コメントと余分な空白を除いたCSS文字列
+    """
+    parts = []
+    pending = []
+
+    def flush():
+        # コメント除去後にまとめて空白を詰める（文字列リテラルには触れない）
+        text = re.sub(r'\s+', ' ', ''.join(pending))
+        text = _PUNCTUATION_SPACE.sub(r'\1', text)
+        parts.append(_COLON_SPACE.sub(':', text).replace(';}', '}'))
+        pending.clear()
+
+    for string, comment, other in _TOKEN_PATTERN.findall(css):
+        if string:
+            flush()
+            parts.append(string)
+        elif other:
+            pending.append(other)
+    flush()
+
+    return ''.join(parts).strip()
+
+
+def main():
+    css = SOURCE_FILE.read_text(encoding='utf-8')
+    minified = minify_css(css)
+    OUTPUT_FILE.write_text(minified + '\n', encoding='utf-8')
+    print(f"{SOURCE_FILE.name}: {len(css.encode('utf-8'))} bytes -> "
+          f"{OUTPUT_FILE.name}: {len(minified.encode('utf-8'))} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,14 +6,23 @@
 
 from .simulator import RegionalLifeSimulator, HokkaidoLifeSimulator, TokyoLifeSimulator
 from .data_loader import REGION_CONFIG
-from .correlation_visualizer import create_correlation_sankey, get_correlation_summary
+from .formatter import score_points
 
 __all__ = [
     "RegionalLifeSimulator",
     "HokkaidoLifeSimulator",  # 後方互換性
     "TokyoLifeSimulator",
     "REGION_CONFIG",
+    "score_points",
     "create_correlation_sankey",
     "get_correlation_summary",
 ]
 __version__ = "2.2.0"
+
+
+def __getattr__(name):
+    # 相関図はplotlyを読み込むため、実際に使われるまでインポートを遅らせる
+    if name in ("create_correlation_sankey", "get_correlation_summary"):
+        from . import correlation_visualizer
+        return getattr(correlation_visualizer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
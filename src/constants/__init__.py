@@ -13,6 +13,7 @@ from .scores import (
     get_lifespan_score,
     get_university_rank,
     get_university_rank_score,
+    get_university_rank_and_score,
     # 親ガチャスコア用
     PARENT_EDUCATION_SCORES,
     HOUSEHOLD_INCOME_SCORES,
@@ -60,6 +61,7 @@ __all__ = [
     "get_lifespan_score",
     "get_university_rank",
     "get_university_rank_score",
+    "get_university_rank_and_score",
     "SNS_REACTIONS",
     # 親ガチャスコア用
     "PARENT_EDUCATION_SCORES",
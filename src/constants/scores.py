@@ -4,6 +4,9 @@
 東京で生まれ育って最大限に充実した人生 = 100点 を基準とする
 """
 
+from bisect import bisect_right
+from functools import lru_cache
+
 # ============================================================================
 # 6段階ランク評価のしきい値
 # 統計的スケール: 平均55点を基準に、正規分布的な評価
@@ -29,6 +32,10 @@ RANK_LABELS = {
     "D": "大ハズレ",
 }
 
+# get_rank用: しきい値の昇順（最下位Dの0点を除く）と対応するランク
+_RANK_ORDER = tuple(sorted(RANK_THRESHOLDS, key=RANK_THRESHOLDS.get))
+_RANK_BOUNDS = tuple(RANK_THRESHOLDS[rank] for rank in _RANK_ORDER[1:])
+
 def get_rank(score: float) -> str:
     """
     スコアからランク（SS/S/A/B/C/D）を取得
@@ -47,18 +54,7 @@ def get_rank(score: float) -> str:
     Returns:
         ランク文字列
     """
-    if score >= RANK_THRESHOLDS["SS"]:
-        return "SS"
-    elif score >= RANK_THRESHOLDS["S"]:
-        return "S"
-    elif score >= RANK_THRESHOLDS["A"]:
-        return "A"
-    elif score >= RANK_THRESHOLDS["B"]:
-        return "B"
-    elif score >= RANK_THRESHOLDS["C"]:
-        return "C"
-    else:
-        return "D"
+    return _RANK_ORDER[bisect_right(_RANK_BOUNDS, score)]
 
 def get_rank_label(rank: str) -> str:
     """
@@ -409,6 +405,16 @@ def get_education_score(
     elif university_name is None:
         university_name = ""
     
+    return _get_education_score_cached(education_level, university_rank, university_name)
+
+
+@lru_cache(maxsize=1024)
+def _get_education_score_cached(
+    education_level: str,
+    university_rank: str,
+    university_name: str,
+) -> float:
+    """get_education_score の本体（学歴・ランク・大学名の組み合わせごとにメモ化）"""
     # 東京大学大学院卒の特別処理
     if education_level == "大学院卒" and university_name == "東京大学":
         key = "東京大学大学院卒"
@@ -641,8 +647,22 @@ def get_university_rank_score(university_name: str) -> int:
     Returns:
         スコア（60〜100）
     """
+    return get_university_rank_and_score(university_name)[1]
+
+
+@lru_cache(maxsize=1024)
+def get_university_rank_and_score(university_name: str) -> tuple:
+    """
+    大学名からランクとスコアを一度に取得（大学名ごとにメモ化）
+    
+    Args:
+        university_name: 大学名
+    
+    Returns:
+        (ランク, スコア) のタプル
+    """
     rank = get_university_rank(university_name)
-    return UNIVERSITY_RANK_SCORES.get(rank, UNIVERSITY_RANK_SCORES["default"])
+    return rank, UNIVERSITY_RANK_SCORES.get(rank, UNIVERSITY_RANK_SCORES["default"])
 
 # ============================================================================
 # 産業別の平均賃金スコア
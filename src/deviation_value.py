@@ -86,6 +86,7 @@ class DeviationValueCalculator:
         mother_education: Optional[str] = None,
         household_income: Optional[str] = None,
         birth_city: Optional[str] = None,
+        rng: Optional[random.Random] = None,
     ) -> float:
         """
         個人の学力偏差値を計算する
@@ -98,6 +99,7 @@ class DeviationValueCalculator:
             mother_education: 母親の最終学歴
             household_income: 世帯年収
             birth_city: 出生地
+            rng: 乱数生成器（Noneの場合はrandomモジュールの関数を使う）
             
         Returns:
             偏差値（30-80程度の範囲）
@@ -134,8 +136,9 @@ class DeviationValueCalculator:
         expected_deviation = base_deviation + parent_education_modifier + income_modifier + region_modifier
         
         # 標準正規分布に従う乱数を生成（Box-Muller法）
-        u1 = random.random()
-        u2 = random.random()
+        rng = rng if rng is not None else random
+        u1 = rng.random()
+        u2 = rng.random()
         z = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
         
         # 標準偏差8の正規分布（環境要因で多少圧縮）
@@ -170,23 +173,28 @@ class DeviationValueCalculator:
             return "bottom"
     
     @staticmethod
-    def get_expected_university_rank(deviation_value: float) -> str:
+    def get_expected_university_rank(
+        deviation_value: float,
+        rng: Optional[random.Random] = None,
+    ) -> str:
         """
         偏差値から期待される大学ランクを取得
         
         Args:
             deviation_value: 偏差値
+            rng: 乱数生成器（Noneの場合はrandomモジュールの関数を使う）
             
         Returns:
             大学ランク（"S", "A", "B", "C", "D"）
         """
+        rng = rng if rng is not None else random
         # 確率的に決定（偏差値に応じてランクが上下する可能性）
         if deviation_value >= 70:
             # 偏差値70+: Sランク70%, Aランク30%
-            return "S" if random.random() < 0.7 else "A"
+            return "S" if rng.random() < 0.7 else "A"
         elif deviation_value >= 60:
             # 偏差値60-69: Sランク10%, Aランク60%, Bランク30%
-            rand = random.random()
+            rand = rng.random()
             if rand < 0.10:
                 return "S"
             elif rand < 0.70:
@@ -195,7 +203,7 @@ class DeviationValueCalculator:
                 return "B"
         elif deviation_value >= 52:
             # 偏差値52-59: Aランク10%, Bランク60%, Cランク30%
-            rand = random.random()
+            rand = rng.random()
             if rand < 0.10:
                 return "A"
             elif rand < 0.70:
@@ -204,7 +212,7 @@ class DeviationValueCalculator:
                 return "C"
         elif deviation_value >= 45:
             # 偏差値45-51: Bランク10%, Cランク60%, Dランク30%
-            rand = random.random()
+            rand = rng.random()
             if rand < 0.10:
                 return "B"
             elif rand < 0.70:
@@ -213,7 +221,7 @@ class DeviationValueCalculator:
                 return "D"
         else:
             # 偏差値45未満: Cランク10%, Dランク90%
-            return "C" if random.random() < 0.1 else "D"
+            return "C" if rng.random() < 0.1 else "D"
     
     @staticmethod
     def get_high_school_deviation_range(individual_deviation: float) -> tuple:
@@ -235,6 +243,7 @@ class DeviationValueCalculator:
     def simulate_academic_growth(
         initial_deviation: float,
         high_school_deviation: float,
+        rng: Optional[random.Random] = None,
     ) -> float:
         """
         高校での学力成長をシミュレート
@@ -244,6 +253,7 @@ class DeviationValueCalculator:
         Args:
             initial_deviation: 入学時の偏差値
             high_school_deviation: 高校の偏差値
+            rng: 乱数生成器（Noneの場合はrandomモジュールの関数を使う）
             
         Returns:
             高校卒業時の偏差値
@@ -252,7 +262,8 @@ class DeviationValueCalculator:
         high_school_effect = (high_school_deviation - 50) * 0.15
         
         # ランダムな成長（-3〜+5）
-        growth = random.uniform(-3, 5)
+        rng = rng if rng is not None else random
+        growth = rng.uniform(-3, 5)
         
         # 最終偏差値
         final_deviation = initial_deviation + high_school_effect + growth
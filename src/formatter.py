@@ -4,11 +4,64 @@
 シミュレーション結果を文字列でフォーマットする
 """
 
-from typing import Dict, List, Any
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Any, TextIO
 
 from .constants import SCORE_WEIGHTS
 
 
+# スコアの解釈（しきい値の昇順と、各区間に対応する評価）
+_INTERPRETATION_THRESHOLDS = (30, 50, 70, 80, 90)
+_INTERPRETATION_LABELS = (
+    "大ハズレ（下位5%相当）",
+    "ハズレ（下位20%相当）",
+    "普通（平均付近）",
+    "当たり（上位20%相当）",
+    "大当たり！（上位5%相当）",
+    "神レベル！（上位1%相当）",
+)
+
+
+
+def score_points(total_score: float) -> int:
+    """
+    総合スコアを整数の点数表示に変換する
+    
+    小数第1位で丸めた表示（:.1f）と食い違わないよう、先に小数第1位で丸めてから切り捨てる
+    
+    Args:
+        total_score: 総合スコア
+    
+    Returns:
+        int: 表示用の点数
+    """
+    return int(round(total_score, 1))
+
+
+# 死因 → 表示用の死因（死因ごとに1回だけ変換する）
+_DEATH_CAUSE_DISPLAY_CACHE: Dict[str, str] = {}
+
+
+def _death_cause_display(death_cause: str) -> str:
+    """
+    死因を表示用の文字列に変換する（悪性新生物・腫瘍は「ガン」と表示）
+    
+    Args:
+        death_cause: 死因
+    
+    Returns:
+        str: 表示用の死因
+    """
+    display = _DEATH_CAUSE_DISPLAY_CACHE.get(death_cause)
+    if display is None:
+        if "悪性新生物" in death_cause or "腫瘍" in death_cause:
+            display = "ガン"
+        else:
+            display = death_cause
+        _DEATH_CAUSE_DISPLAY_CACHE[death_cause] = display
+    return display
+
+
 class LifeFormatter:
     """人生データのフォーマットを担当するクラス"""
     
@@ -33,6 +86,7 @@ class LifeFormatter:
         show_score: bool = True,
         verbose_score: bool = True,
         show_sns: bool = True,
+        derived: Dict[str, Any] = None,
     ) -> str:
         """
         人生の軌跡を文字列でフォーマット
@@ -44,11 +98,19 @@ class LifeFormatter:
             show_score: スコアを表示するかどうか
             verbose_score: スコアの詳細な根拠を表示するかどうか
             show_sns: SNS反応を表示するかどうか
+            derived: スコア計算の途中で得た値（生涯年収など）。あれば再計算しない
             
         Returns:
             フォーマットされた文字列
         """
-        result = self._format_life_story(life)
+        if derived is None and score_result:
+            derived = score_result.get("derived")
+        
+        # 全表示（CLIのデフォルト）は分岐なしの専用パスで処理
+        if show_score and show_sns and verbose_score and score_result and sns_reactions:
+            return self._format_life_full(life, score_result, sns_reactions, derived)
+        
+        result = self._format_life_story(life, derived)
         
         # スコアを表示する場合
         if show_score and score_result:
@@ -60,7 +122,22 @@ class LifeFormatter:
         
         return result
     
-    def _format_life_story(self, life: Dict[str, Any]) -> str:
+    def _format_life_full(
+        self,
+        life: Dict[str, Any],
+        score_result: Dict[str, Any],
+        sns_reactions: List[str],
+        derived: Dict[str, Any] = None,
+    ) -> str:
+        """ストーリー・詳細スコア・SNS反応をすべて表示する場合のフォーマット"""
+        return "\n".join((
+            self._format_life_story(life, derived),
+            "",
+            self.format_score_breakdown(score_result, True),
+            self.format_sns_reactions(sns_reactions),
+        ))
+    
+    def _format_life_story(self, life: Dict[str, Any], derived: Dict[str, Any] = None) -> str:
         """人生のストーリー部分をフォーマット"""
         # 出生地（市町村名）と両親の学歴
         birth_city = life['birth_city']
@@ -144,15 +221,16 @@ class LifeFormatter:
         death_age = life['death_age']
         
         # 死因の表示
-        death_cause = life['death_cause']
-        if "悪性新生物" in death_cause or "腫瘍" in death_cause:
-            death_cause = "ガン"
+        death_cause = _death_cause_display(life['death_cause'])
         
-        # 生涯年収を計算（LifeScorerを使用）
-        from .scoring import LifeScorer
-        scorer = LifeScorer()
-        income_result = scorer.calculate_lifetime_income(life)
-        lifetime_income = income_result["total"]  # 万円
+        # 生涯年収（スコア計算済みならその値を使い、なければLifeScorerで計算）
+        if derived and "lifetime_income" in derived:
+            lifetime_income = derived["lifetime_income"]  # 万円
+        else:
+            from .scoring import LifeScorer
+            scorer = LifeScorer()
+            income_result = scorer.calculate_lifetime_income(life)
+            lifetime_income = income_result["total"]  # 万円
         lifetime_income_oku = lifetime_income / 10000  # 億円に変換
         
         # 定年退職できたか、その前に死亡したかで表示を分ける
@@ -230,18 +308,41 @@ class LifeFormatter:
         Returns:
             フォーマットされたスコア情報
         """
-        lines = []
-        lines.append("=" * 60)
-        lines.append(f"【人生スコア】 {score_result['total_score']:.1f} / 100点")
-        lines.append("=" * 60)
-        lines.append(f"ランク: {score_result.get('rank', '-')} ({score_result.get('rank_label', '-')})")
-        lines.append(f"計算方法: {score_result.get('calculation_method', '-')}")
-        lines.append("")
+        return "\n".join(self._iter_score_breakdown(score_result, verbose))
+    
+    def write_score_breakdown(
+        self,
+        file: TextIO,
+        score_result: Dict[str, Any],
+        verbose: bool = True,
+    ) -> None:
+        """
+        スコアの内訳をファイル（標準出力など）に直接書き出す
+        
+        Args:
+            file: 書き込み先（write()/writelines()を持つテキストストリーム）
+            score_result: calculate_life_score()の戻り値
+            verbose: 詳細な根拠を表示するかどうか
+        """
+        file.writelines(line + "\n" for line in self._iter_score_breakdown(score_result, verbose))
+    
+    def _iter_score_breakdown(
+        self,
+        score_result: Dict[str, Any],
+        verbose: bool = True,
+    ) -> Iterator[str]:
+        """スコアの内訳を1行ずつ生成する"""
+        yield "=" * 60
+        yield f"【人生スコア】 {score_result['total_score']:.1f} / 100点"
+        yield "=" * 60
+        yield f"ランク: {score_result.get('rank', '-')} ({score_result.get('rank_label', '-')})"
+        yield f"計算方法: {score_result.get('calculation_method', '-')}"
+        yield ""
         
         breakdown = score_result["breakdown"]
         
-        lines.append("【スコア内訳】")
-        lines.append("-" * 60)
+        yield "【スコア内訳】"
+        yield "-" * 60
         
         # 新しいキー構造に対応（education、lifetime_income、lifespan）
         for key in ["education", "lifetime_income", "lifespan"]:
@@ -250,38 +351,25 @@ class LifeFormatter:
             item = breakdown[key]
             score = item["score"]
             
-            lines.append(f"  {item['label']}: {score}点")
-            lines.append(f"    → {item['value']}")
+            yield f"  {item['label']}: {score}点"
+            yield f"    → {item['value']}"
             
             if verbose:
-                lines.append(f"    理由: {item['reason']}")
+                yield f"    理由: {item['reason']}"
                 if item.get('source') and item['source'] != "-":
-                    lines.append(f"    出典: {item['source']}")
-            lines.append("")
+                    yield f"    出典: {item['source']}"
+            yield ""
         
-        lines.append("-" * 60)
-        lines.append(f"総合スコア: {score_result['total_score']:.1f}点")
-        lines.append("")
+        yield "-" * 60
+        yield f"総合スコア: {score_result['total_score']:.1f}点"
+        yield ""
         
         # スコアの解釈
-        total = score_result['total_score']
-        if total >= 90:
-            interpretation = "神レベル！（上位1%相当）"
-        elif total >= 80:
-            interpretation = "大当たり！（上位5%相当）"
-        elif total >= 70:
-            interpretation = "当たり（上位20%相当）"
-        elif total >= 50:
-            interpretation = "普通（平均付近）"
-        elif total >= 30:
-            interpretation = "ハズレ（下位20%相当）"
-        else:
-            interpretation = "大ハズレ（下位5%相当）"
+        # しきい値は表示と同じ小数第1位で丸めた値で判定する
+        total = round(score_result['total_score'], 1)
+        interpretation = _INTERPRETATION_LABELS[bisect_right(_INTERPRETATION_THRESHOLDS, total)]
         
-        lines.append(f"【評価】 {interpretation}")
-        
-        return "\n".join(lines)
-        return "\n".join(lines)
+        yield f"【評価】 {interpretation}"
     
     def format_sns_reactions(self, reactions: List[str]) -> str:
         """
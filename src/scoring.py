@@ -6,7 +6,10 @@
 - 人生スコア: 最終学歴、生涯年収、寿命
 """
 
-from typing import Dict, Any
+import math
+import operator
+from collections import namedtuple
+from typing import Dict, Any, Iterable
 
 from .constants import (
     LOCATION_SCORES,
@@ -36,6 +39,250 @@ from .constants import (
 )
 
 
+# 加重和（Python 3.12以降はmath.sumprodを使う）
+try:
+    from math import sumprod as _sumprod
+except ImportError:  # Python 3.11以前
+    def _sumprod(values, weights) -> float:
+        return sum(map(operator.mul, values, weights))
+
+
+# 性別ごとの平均寿命（厚生労働省「簡易生命表」2024年）
+_AVG_LIFESPAN = {"男性": 81.09, "女性": 87.13}
+
+# 性別による生涯年収の補正係数（男性100に対し女性76）
+_GENDER_MULT = {"男性": 1.0, "女性": 0.76}
+
+# 産業名 → 産業スコアの解決結果（部分一致による判定は産業名ごとに1回だけ行う）
+_INDUSTRY_SCORE_CACHE: Dict[str, int] = {}
+
+
+def _resolve_industry_score(industry: str) -> int:
+    """
+    産業名から産業スコアを取得する（INDUSTRY_SALARY_SCORESとの部分一致）
+    
+    Args:
+        industry: 産業名
+    
+    Returns:
+        int: 産業スコア（一致しなければdefault）
+    """
+    industry_score = _INDUSTRY_SCORE_CACHE.get(industry)
+    if industry_score is None:
+        industry_score = INDUSTRY_SALARY_SCORES.get("default")
+        for ind_name, ind_score in INDUSTRY_SALARY_SCORES.items():
+            if ind_name in industry or industry in ind_name:
+                industry_score = ind_score
+                break
+        _INDUSTRY_SCORE_CACHE[industry] = industry_score
+    return industry_score
+
+
+# 人生スコアのキャッシュ件数の上限（超えたら古いものから捨てる）
+_LIFE_SCORE_CACHE_SIZE = 4096
+
+# キャッシュする人生スコアの数値部分（変更できない値だけを持つ）
+# income_items は calculate_lifetime_income() の結果を (キー, 値) のタプルにしたもの
+_LifeScoreNumbers = namedtuple(
+    "_LifeScoreNumbers",
+    (
+        "education_level",
+        "lifetime_income",
+        "income_items",
+        "education_score",
+        "lifetime_income_score",
+        "lifespan_score",
+        "total_score",
+        "rank",
+        "rank_label",
+    ),
+)
+
+
+def _life_score_key(life: Dict[str, Any]) -> tuple:
+    """
+    人生スコアの計算に使う項目だけを取り出したキャッシュキーを作る
+    
+    Args:
+        life: generate_life()で生成された人生データ
+    
+    Returns:
+        tuple: ハッシュ可能なキー
+    """
+    university_name = life.get("university_name")
+    if isinstance(university_name, dict):
+        university_name_key = (True, university_name.get("name", ""))
+    else:
+        university_name_key = (bool(university_name), university_name)
+    
+    entrepreneur_info = life.get("entrepreneur_info")
+    if entrepreneur_info and entrepreneur_info.get("is_entrepreneur"):
+        entrepreneur_key = (
+            entrepreneur_info.get("income_multiplier", 1.0),
+            entrepreneur_info.get("success_tier"),
+        )
+    else:
+        entrepreneur_key = None
+    
+    executive_info = life.get("executive_info")
+    if executive_info and executive_info.get("is_executive"):
+        executive_key = (
+            executive_info.get("income_multiplier", 1.0),
+            executive_info.get("executive_level"),
+        )
+    else:
+        executive_key = None
+    
+    return (
+        bool(life.get("graduate_school")),
+        bool(life.get("university")),
+        bool(life.get("vocational_school")),
+        bool(life.get("high_school")),
+        life.get("university_rank"),
+        university_name_key,
+        life.get("death_age", 80),
+        life.get("retirement_age"),
+        life.get("gender", "男性"),
+        life.get("industry", ""),
+        life.get("company_size", "中企業"),
+        life.get("employment_type", "正社員"),
+        entrepreneur_key,
+        executive_key,
+    )
+
+
+# 人生スコアの重み（最終学歴30%、生涯年収40%、寿命30%）
+_LIFE_SCORE_WEIGHTS = (0.30, 0.40, 0.30)
+_LIFE_SCORE_METHOD = "人生スコア（最終学歴30%、生涯年収40%、寿命30%）"
+
+
+def _life_score_kernel(
+    education_level: str,
+    university_rank,
+    university_name,
+    lifetime_income: float,
+    death_age: int,
+    gender: str,
+) -> tuple:
+    """
+    人生スコアの数値計算部分（表示用の文字列・辞書は作らない）
+    
+    Args:
+        education_level: 最終学歴（"大学院卒", "大学卒", "短大・専門卒", "高校卒", "中学卒"）
+        university_rank: 大学ランク（なければNone）
+        university_name: 大学名（なければNone）
+        lifetime_income: 生涯年収（万円）
+        death_age: 死亡年齢
+        gender: 性別
+    
+    Returns:
+        tuple: (最終学歴スコア, 生涯年収スコア, 寿命スコア, 総合スコア)
+    """
+    education_score = get_education_score(
+        education_level=education_level,
+        university_rank=university_rank,
+        university_name=university_name,
+    )
+    lifetime_income_score = get_lifetime_income_score(lifetime_income)
+    lifespan_score = get_lifespan_score(death_age, gender)
+    total_score = _sumprod(
+        (education_score, lifetime_income_score, lifespan_score),
+        _LIFE_SCORE_WEIGHTS,
+    )
+    return education_score, lifetime_income_score, lifespan_score, total_score
+
+
+# スコア内訳の理由文のうち、取りうる値が限られるもの（呼び出しごとにf文字列を組み立てない）
+_EDUCATION_REASON = {
+    level: f"{level}（パーセンタイルベースの統計的スコアリング）"
+    for level in ("大学院卒", "大学卒", "短大・専門卒", "高校卒", "中学卒")
+}
+_LIFESPAN_REASON_SUFFIX = {
+    gender: f"歳で死亡（平均寿命: {gender}{avg_lifespan}歳）"
+    for gender, avg_lifespan in _AVG_LIFESPAN.items()
+}
+_HOUSEHOLD_INCOME_REASON = {
+    income_range: f"世帯年収{income_range}"
+    for income_range in HOUSEHOLD_INCOME_SCORES
+    if income_range != "default"
+}
+_COMPANY_SIZE_NOTE = {
+    company_size: f"{company_size}×{multiplier:.2f}"
+    for company_size, multiplier in COMPANY_SIZE_SALARY_MULTIPLIER.items()
+}
+_EMPLOYMENT_TYPE_NOTE = {
+    employment_type: f"{employment_type}×{multiplier:.2f}"
+    for employment_type, multiplier in EMPLOYMENT_TYPE_SALARY_MULTIPLIER.items()
+}
+
+
+# ランクごとのスコアの解釈
+_SCORE_INTERPRETATIONS = {
+    "SS": "神レベル！（上位1%相当）",
+    "S": "大当たり！（上位5%相当）",
+    "A": "当たり（上位20%相当）",
+    "B": "普通（平均付近）",
+    "C": "ハズレ（下位20%相当）",
+    "D": "大ハズレ（下位5%相当）",
+}
+
+
+# スコア内訳のテンプレート（固定項目のみ。呼び出しごとにコピーして動的項目を上書きする）
+_PARENT_EDUCATION_TEMPLATE = {
+    "score": 0,
+    "max_score": 100,
+    "label": "親の学歴",
+    "value": "",
+    "reason": "",
+    "source": "文部科学省「学校基本調査」",
+}
+
+_HOUSEHOLD_INCOME_TEMPLATE = {
+    "score": 0,
+    "max_score": 100,
+    "label": "世帯年収",
+    "value": "",
+    "reason": "",
+    "source": "厚生労働省「国民生活基礎調査」",
+}
+
+_BIRTHPLACE_TEMPLATE = {
+    "score": 0,
+    "max_score": 100,
+    "label": "出生地",
+    "value": "",
+    "reason": "",
+    "source": "総務省「住宅・土地統計調査」、文部科学省「学校基本調査」、厚生労働省「一般職業紹介状況」",
+}
+
+_EDUCATION_TEMPLATE = {
+    "score": 0,
+    "max_score": 100,
+    "label": "最終学歴",
+    "value": "",
+    "reason": "",
+    "source": "文部科学省「学校基本調査」・2020年国勢調査に基づく",
+}
+
+_LIFETIME_INCOME_TEMPLATE = {
+    "score": 0,
+    "max_score": 100,
+    "label": "生涯年収",
+    "value": "",
+    "reason": "",
+    "source": "労働政策研究・研修機構「ユースフル労働統計」",
+}
+
+_LIFESPAN_TEMPLATE = {
+    "score": 0,
+    "max_score": 100,
+    "label": "寿命",
+    "value": "",
+    "reason": "",
+    "source": "厚生労働省「簡易生命表」2024年",
+}
+
+
 class LifeScorer:
     """人生スコアを計算するクラス"""
     
@@ -48,6 +295,24 @@ class LifeScorer:
                              キー: 市区町村名、値: スコア（0-100）
         """
         self.birthplace_scores = birthplace_scores or {}
+        self._life_score_cache: Dict[tuple, _LifeScoreNumbers] = {}
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """pickle時はスコアのキャッシュを含めない（並列生成でワーカーへ渡す際のサイズ削減）"""
+        state = self.__dict__.copy()
+        state["_life_score_cache"] = {}
+        return state
+    
+    @staticmethod
+    def register_industries(industries: Iterable[str]) -> None:
+        """
+        産業名の産業スコアを事前に解決しておく
+        
+        Args:
+            industries: 産業名の一覧（workers_by_industryの産業名など）
+        """
+        for industry in industries:
+            _resolve_industry_score(industry)
     
     def get_birthplace_score(self, city: str, region: str = "") -> tuple:
         """
@@ -106,27 +371,21 @@ class LifeScorer:
         mother_edu_score = PARENT_EDUCATION_SCORES.get(mother_edu, PARENT_EDUCATION_SCORES["default"])
         parent_edu_score = (father_edu_score + mother_edu_score) / 2
         
-        scores["parent_education"] = {
-            "score": parent_edu_score,
-            "max_score": 100,
-            "label": "親の学歴",
-            "value": f"父:{father_edu} / 母:{mother_edu}",
-            "reason": f"父親{father_edu_score}点 + 母親{mother_edu_score}点 の平均",
-            "source": "文部科学省「学校基本調査」"
-        }
+        item = _PARENT_EDUCATION_TEMPLATE.copy()
+        item["score"] = parent_edu_score
+        item["value"] = f"父:{father_edu} / 母:{mother_edu}"
+        item["reason"] = f"父親{father_edu_score}点 + 母親{mother_edu_score}点 の平均"
+        scores["parent_education"] = item
         
         # 2. 世帯年収スコア
         household_income = life.get("household_income", "400〜600万円")
         income_score = HOUSEHOLD_INCOME_SCORES.get(household_income, HOUSEHOLD_INCOME_SCORES["default"])
         
-        scores["household_income"] = {
-            "score": income_score,
-            "max_score": 100,
-            "label": "世帯年収",
-            "value": household_income,
-            "reason": f"世帯年収{household_income}",
-            "source": "厚生労働省「国民生活基礎調査」"
-        }
+        item = _HOUSEHOLD_INCOME_TEMPLATE.copy()
+        item["score"] = income_score
+        item["value"] = household_income
+        item["reason"] = _HOUSEHOLD_INCOME_REASON.get(household_income) or f"世帯年収{household_income}"
+        scores["household_income"] = item
         
         # 3. 出生地スコア（市区町村別）
         birth_city = life.get("birth_city", "")
@@ -135,14 +394,11 @@ class LifeScorer:
         # 市区町村別スコアを取得
         birthplace_score, region_name = self.get_birthplace_score(birth_city, region)
         
-        scores["birthplace"] = {
-            "score": birthplace_score,
-            "max_score": 100,
-            "label": "出生地",
-            "value": f"{birth_city}（{region_name}）",
-            "reason": f"{birth_city}生まれ（世帯年収・大学進学率・有効求人倍率の複合指標）",
-            "source": "総務省「住宅・土地統計調査」、文部科学省「学校基本調査」、厚生労働省「一般職業紹介状況」"
-        }
+        item = _BIRTHPLACE_TEMPLATE.copy()
+        item["score"] = birthplace_score
+        item["value"] = f"{birth_city}（{region_name}）"
+        item["reason"] = f"{birth_city}生まれ（世帯年収・大学進学率・有効求人倍率の複合指標）"
+        scores["birthplace"] = item
         
         # 総合スコア計算（極端な値の影響を強化）
         # 基本: 親の学歴40%、世帯年収40%、出生地20%
@@ -182,10 +438,9 @@ class LifeScorer:
                 edu_weight = 0.25
                 income_weight = 0.55
 
-        total_score = (
-            parent_edu_score * edu_weight +
-            income_score * income_weight +
-            birthplace_score * birthplace_weight
+        total_score = _sumprod(
+            (parent_edu_score, income_score, birthplace_score),
+            (edu_weight, income_weight, birthplace_weight),
         )
         
         # ランク判定
@@ -193,7 +448,7 @@ class LifeScorer:
         rank_label = get_rank_label(rank)
         
         return {
-            "total_score": round(total_score, 1),
+            "total_score": total_score,
             "rank": rank,
             "rank_label": rank_label,
             "breakdown": scores,
@@ -253,24 +508,16 @@ class LifeScorer:
         else:
             working_years_ratio = 1.0
         
-        lifetime_income = base_income * working_years_ratio
-        
         # 産業による補正（産業スコアを年収に反映）
         industry = life.get("industry", "")
-        industry_score = INDUSTRY_SALARY_SCORES.get("default")
-        for ind_name, ind_score in INDUSTRY_SALARY_SCORES.items():
-            if ind_name in industry or industry in ind_name:
-                industry_score = ind_score
-                break
+        industry_score = _resolve_industry_score(industry)
         
         # 産業スコア（0-100）を補正係数（0.7-1.3）に変換
         industry_multiplier = 0.7 + (industry_score / 100) * 0.6
-        lifetime_income *= industry_multiplier
         
         # 性別による補正
         gender = life.get("gender", "男性")
-        gender_multiplier = 0.76 if gender == "女性" else 1.0
-        lifetime_income *= gender_multiplier
+        gender_multiplier = _GENDER_MULT.get(gender, 1.0)
         
         # 企業規模による補正（大企業1.00、中企業0.82、小企業0.72）
         company_size = life.get("company_size", "中企業")
@@ -278,7 +525,6 @@ class LifeScorer:
             company_size,
             COMPANY_SIZE_SALARY_MULTIPLIER["default"]
         )
-        lifetime_income *= company_size_multiplier
         
         # 雇用形態による補正（正社員1.00、非正規0.65）
         employment_type = life.get("employment_type", "正社員")
@@ -286,7 +532,6 @@ class LifeScorer:
             employment_type,
             EMPLOYMENT_TYPE_SALARY_MULTIPLIER["default"]
         )
-        lifetime_income *= employment_type_multiplier
         
         # 大学ランクによる補正（Sランク大学卒は年収が高い傾向）
         university_rank = life.get("university_rank")
@@ -300,7 +545,6 @@ class LifeScorer:
                 "D": 0.92,  # その他大卒: -8%
             }
             university_rank_multiplier = university_rank_multipliers.get(university_rank, 1.0)
-            lifetime_income *= university_rank_multiplier
         
         # 起業家・経営者ルートによる補正
         entrepreneur_info = life.get("entrepreneur_info")
@@ -315,12 +559,23 @@ class LifeScorer:
         if entrepreneur_info and entrepreneur_info.get("is_entrepreneur"):
             entrepreneur_multiplier = entrepreneur_info.get("income_multiplier", 1.0)
             entrepreneur_label = entrepreneur_info.get("success_tier")
-            lifetime_income *= entrepreneur_multiplier
         # 役員の場合
         elif executive_info and executive_info.get("is_executive"):
             executive_multiplier = executive_info.get("income_multiplier", 1.0)
             executive_label = executive_info.get("executive_level")
-            lifetime_income *= executive_multiplier
+        
+        # 全補正係数を一度に掛け合わせる
+        lifetime_income = math.prod((
+            base_income,
+            working_years_ratio,
+            industry_multiplier,
+            gender_multiplier,
+            company_size_multiplier,
+            employment_type_multiplier,
+            university_rank_multiplier,
+            entrepreneur_multiplier,
+            executive_multiplier,
+        ))
         
         return {
             "total": round(lifetime_income, 0),
@@ -342,19 +597,41 @@ class LifeScorer:
             "executive_label": executive_label,
         }
     
-    def calculate_life_score(self, life: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_life_score(self, life: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
         """
         人生スコアを計算する（0〜100点）
         最終学歴、生涯年収、寿命の3要素で算定
         
+        同じ人生データの再計算を避けるため数値部分（_LifeScoreNumbers）をキャッシュし、
+        結果の辞書は呼び出しごとに新しく組み立てる。
+        
         Args:
             life: generate_life()で生成された人生データ
-            
+            verbose: Falseの場合は各項目のスコア詳細（breakdown）を作らずNoneにする
+        
         Returns:
-            dict: 総合スコアとランク、各項目のスコア詳細
+            dict: 総合スコアとランク、各項目のスコア詳細、計算途中の値（derived）
         """
-        scores = {}
+        key = _life_score_key(life)
+        numbers = self._life_score_cache.get(key)
+        if numbers is None:
+            numbers = self._calculate_life_score_numbers(life)
+            if len(self._life_score_cache) >= _LIFE_SCORE_CACHE_SIZE:
+                # 最も古いエントリを捨てる（dictは挿入順を保持する）
+                del self._life_score_cache[next(iter(self._life_score_cache))]
+            self._life_score_cache[key] = numbers
+        return self._build_life_score_result(life, numbers, verbose)
+    
+    def _calculate_life_score_numbers(self, life: Dict[str, Any]) -> _LifeScoreNumbers:
+        """
+        人生スコアの数値部分を計算する（キャッシュなし）
         
+        Args:
+            life: generate_life()で生成された人生データ
+            
+        Returns:
+            _LifeScoreNumbers: 最終学歴・生涯年収と各項目のスコア、総合スコアとランク
+        """
         # 1. 最終学歴スコア（パーセンタイルベース）
         if life.get("graduate_school"):
             education_level = "大学院卒"
@@ -367,16 +644,80 @@ class LifeScorer:
         else:
             education_level = "中学卒"
         
-        # 大学ランクと大学名を取得
-        university_rank = life.get("university_rank")
-        university_name = life.get("university_name")
+        # 数値スコアをまとめて計算（内訳の組み立てとは分離）
+        income_result = self.calculate_lifetime_income(life)
+        lifetime_income = income_result["total"]
+        education_score, lifetime_income_score, lifespan_score, total_score = _life_score_kernel(
+            education_level,
+            life.get("university_rank"),
+            life.get("university_name"),
+            lifetime_income,
+            life.get("death_age", 80),
+            life.get("gender", "男性"),
+        )
         
-        # パーセンタイルベースのスコア計算
-        education_score = get_education_score(
-            education_level=education_level,
-            university_rank=university_rank,
-            university_name=university_name,
+        # ランク判定
+        rank = get_rank(total_score)
+        return _LifeScoreNumbers(
+            education_level,
+            lifetime_income,
+            tuple(income_result.items()),
+            education_score,
+            lifetime_income_score,
+            lifespan_score,
+            total_score,
+            rank,
+            get_rank_label(rank),
         )
+    
+    def _build_life_score_result(
+        self,
+        life: Dict[str, Any],
+        numbers: _LifeScoreNumbers,
+        verbose: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        数値部分から人生スコアの結果辞書を組み立てる（呼び出しごとに新しい辞書を作る）
+        
+        Args:
+            life: generate_life()で生成された人生データ
+            numbers: _calculate_life_score_numbers() の結果
+            verbose: Falseの場合は各項目のスコア詳細（breakdown）を作らない
+        
+        Returns:
+            dict: 総合スコアとランク、各項目のスコア詳細
+        """
+        education_level = numbers.education_level
+        lifetime_income = numbers.lifetime_income
+        total_score = numbers.total_score
+        rank = numbers.rank
+        rank_label = numbers.rank_label
+        
+        # 計算途中で得た値（フォーマッター等が同じ計算を繰り返さないよう結果に含める）
+        derived = {
+            "education_level": education_level,
+            "lifetime_income": lifetime_income,
+        }
+        
+        if not verbose:
+            return {
+                "total_score": total_score,
+                "rank": rank,
+                "rank_label": rank_label,
+                "breakdown": None,
+                "calculation_method": _LIFE_SCORE_METHOD,
+                "derived": derived,
+            }
+        
+        scores = {}
+        university_rank = life.get("university_rank")
+        university_name = life.get("university_name")
+        death_age = life.get("death_age", 80)
+        gender = life.get("gender", "男性")
+        income_result = dict(numbers.income_items)
+        education_score = numbers.education_score
+        lifetime_income_score = numbers.lifetime_income_score
+        lifespan_score = numbers.lifespan_score
         
         # 表示用の値を作成
         if education_level == "大学院卒" and university_name:
@@ -400,22 +741,17 @@ class LifeScorer:
         else:
             education_display = education_level
         
-        scores["education"] = {
-            "score": education_score,
-            "max_score": 100,
-            "label": "最終学歴",
-            "value": education_display,
-            "reason": f"{education_display}（パーセンタイルベースの統計的スコアリング）",
-            "source": "文部科学省「学校基本調査」・2020年国勢調査に基づく"
-        }
+        item = _EDUCATION_TEMPLATE.copy()
+        item["score"] = education_score
+        item["value"] = education_display
+        item["reason"] = (
+            _EDUCATION_REASON.get(education_display)
+            or f"{education_display}（パーセンタイルベースの統計的スコアリング）"
+        )
+        scores["education"] = item
         
         # 2. 生涯年収スコア
-        income_result = self.calculate_lifetime_income(life)
-        lifetime_income = income_result["total"]
-        lifetime_income_score = get_lifetime_income_score(lifetime_income)
-        
         # 定年前死亡の場合の注記
-        death_age = life.get("death_age", 80)
         retirement_age = life.get("retirement_age") or 65
         if death_age < retirement_age:
             income_note = f"（{death_age}歳で死亡のため按分）"
@@ -425,53 +761,45 @@ class LifeScorer:
         # 補正係数の説明文を生成
         multiplier_details = []
         if income_result["company_size_multiplier"] != 1.0:
-            multiplier_details.append(f"{income_result['company_size']}×{income_result['company_size_multiplier']:.2f}")
+            company_size = income_result["company_size"]
+            multiplier_details.append(
+                _COMPANY_SIZE_NOTE.get(company_size)
+                or f"{company_size}×{income_result['company_size_multiplier']:.2f}"
+            )
         if income_result["employment_type_multiplier"] != 1.0:
-            multiplier_details.append(f"{income_result['employment_type']}×{income_result['employment_type_multiplier']:.2f}")
+            employment_type = income_result["employment_type"]
+            multiplier_details.append(
+                _EMPLOYMENT_TYPE_NOTE.get(employment_type)
+                or f"{employment_type}×{income_result['employment_type_multiplier']:.2f}"
+            )
         multiplier_note = f"（{', '.join(multiplier_details)}）" if multiplier_details else ""
         
-        scores["lifetime_income"] = {
-            "score": lifetime_income_score,
-            "max_score": 100,
-            "label": "生涯年収",
-            "value": f"約{lifetime_income/10000:.1f}億円{income_note}",
-            "reason": f"推定生涯年収{lifetime_income:.0f}万円{multiplier_note}",
-            "source": "労働政策研究・研修機構「ユースフル労働統計」",
-            "raw_value": lifetime_income,
-            "income_details": income_result,
-        }
+        item = _LIFETIME_INCOME_TEMPLATE.copy()
+        item["score"] = lifetime_income_score
+        item["value"] = f"約{lifetime_income/10000:.1f}億円{income_note}"
+        item["reason"] = f"推定生涯年収{lifetime_income:.0f}万円{multiplier_note}"
+        item["raw_value"] = lifetime_income
+        item["income_details"] = income_result
+        scores["lifetime_income"] = item
         
         # 3. 寿命スコア
-        lifespan_score = get_lifespan_score(death_age, life.get("gender", "男性"))
-        avg_lifespan = 81.09 if life.get("gender") == "男性" else 87.13
-        
-        scores["lifespan"] = {
-            "score": lifespan_score,
-            "max_score": 100,
-            "label": "寿命",
-            "value": f"{death_age}歳",
-            "reason": f"{death_age}歳で死亡（平均寿命: {life.get('gender', '男性')}{avg_lifespan}歳）",
-            "source": "厚生労働省「簡易生命表」2024年"
-        }
-        
-        # 総合スコア計算（3要素の加重平均）
-        # 最終学歴30%、生涯年収40%、寿命30%
-        total_score = (
-            education_score * 0.30 +
-            lifetime_income_score * 0.40 +
-            lifespan_score * 0.30
-        )
-        
-        # ランク判定
-        rank = get_rank(total_score)
-        rank_label = get_rank_label(rank)
+        item = _LIFESPAN_TEMPLATE.copy()
+        item["score"] = lifespan_score
+        item["value"] = f"{death_age}歳"
+        reason_suffix = _LIFESPAN_REASON_SUFFIX.get(life.get("gender"))
+        if reason_suffix is None:
+            # 男性・女性以外（性別の指定なしを含む）の平均寿命は女性の値を表示する
+            reason_suffix = f"歳で死亡（平均寿命: {gender}{_AVG_LIFESPAN['女性']}歳）"
+        item["reason"] = f"{death_age}{reason_suffix}"
+        scores["lifespan"] = item
         
         return {
-            "total_score": round(total_score, 1),
+            "total_score": total_score,
             "rank": rank,
             "rank_label": rank_label,
             "breakdown": scores,
-            "calculation_method": "人生スコア（最終学歴30%、生涯年収40%、寿命30%）",
+            "calculation_method": _LIFE_SCORE_METHOD,
+            "derived": derived,
         }
     
     def calculate_all_scores(self, life: Dict[str, Any]) -> Dict[str, Any]:
@@ -504,16 +832,6 @@ class LifeScorer:
         Returns:
             解釈文字列
         """
-        rank = get_rank(total_score)
-        if rank == "SS":
-            return "神レベル！（上位1%相当）"
-        elif rank == "S":
-            return "大当たり！（上位5%相当）"
-        elif rank == "A":
-            return "当たり（上位20%相当）"
-        elif rank == "B":
-            return "普通（平均付近）"
-        elif rank == "C":
-            return "ハズレ（下位20%相当）"
-        else:
-            return "大ハズレ（下位5%相当）"
+        # 表示と同じ小数第1位で丸めた値で判定する
+        rank = get_rank(round(total_score, 1))
+        return _SCORE_INTERPRETATIONS.get(rank, _SCORE_INTERPRETATIONS["D"])
@@ -4,8 +4,11 @@
 各モジュールを統合してシミュレーションを実行する
 """
 
+import copy
+import random
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, List, Any, Optional
 
 from .data_loader import DataLoader, REGION_CONFIG
 from .simulators import BirthSimulator, EducationSimulator, CareerSimulator, DeathSimulator
@@ -14,6 +17,57 @@ from .sns_generator import SNSReactionGenerator
 from .formatter import LifeFormatter
 
 
+# 同じデータから構築したシミュレーターのキャッシュ（累積重み・率の早見表の再構築を省く）
+_SIMULATOR_CACHE_SIZE = 8
+_simulator_cache: Dict[tuple, Any] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """辞書・リストを入れ子ごとタプルに変換（キャッシュのキー用）"""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _get_cached_simulator(simulator_class: type, **data: Any) -> Any:
+    """
+    同じ入力データのシミュレーターがあれば再利用し、なければ構築してキャッシュする
+    
+    Args:
+        simulator_class: シミュレーターのクラス
+        **data: コンストラクタに渡すデータ
+    
+    Returns:
+        シミュレーターのインスタンス
+    """
+    key = (simulator_class, _freeze(data))
+    simulator = _simulator_cache.get(key)
+    if simulator is None:
+        if len(_simulator_cache) >= _SIMULATOR_CACHE_SIZE:
+            # 最も古いものから破棄
+            del _simulator_cache[next(iter(_simulator_cache))]
+        simulator = _simulator_cache[key] = simulator_class(**data)
+    return simulator
+
+
+# generate_lives_parallel のワーカープロセスごとのシミュレーター
+_worker_simulator = None
+
+
+def _init_worker(simulator: "RegionalLifeSimulator") -> None:
+    """ワーカープロセスの初期化（親から受け取ったシミュレーターを保持する）"""
+    global _worker_simulator
+    _worker_simulator = simulator
+
+
+def _generate_lives_chunk(seed: int, n: int) -> List[Dict[str, Any]]:
+    """ワーカープロセスでn人分の人生を生成（チャンクごとに乱数シードを設定）"""
+    random.seed(seed)
+    return _worker_simulator.generate_lives(n)
+
+
 class RegionalLifeSimulator:
     """
     地域別人生シミュレーターのメインクラス
@@ -61,21 +115,68 @@ class RegionalLifeSimulator:
             parent_income_effect=self.data_loader.parent_income_effect,
         )
         
-        self.career_sim = CareerSimulator(
+        # キャリア・死亡は同じデータなら構築済みのシミュレーターを再利用する
+        self.career_sim = _get_cached_simulator(
+            CareerSimulator,
             workers_by_industry=self.data_loader.workers_by_industry,
             workers_by_industry_gender=self.data_loader.workers_by_industry_gender,
             retirement_age_distribution=self.data_loader.retirement_age_distribution,
         )
         
-        self.death_sim = DeathSimulator(
+        self.death_sim = _get_cached_simulator(
+            DeathSimulator,
             death_by_age=self.data_loader.death_by_age,
             death_by_cause=self.data_loader.death_by_cause,
         )
         
         # スコア計算・SNS生成・フォーマッターの初期化
         self.scorer = LifeScorer(birthplace_scores=self.data_loader.birthplace_scores)
+        self.scorer.register_industries(
+            row["industry"] for row in self.data_loader.workers_by_industry
+        )
         self.sns_generator = SNSReactionGenerator()
+        self.sns_generator.register_death_causes(
+            row["cause"] for row in self.data_loader.death_by_cause
+        )
         self.formatter = LifeFormatter(region=region)
+        
+        # 偏差値計算で使う乱数生成器（各シミュレーターと同じくデフォルトはrandomモジュール）
+        self._rng = random
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """pickle時、randomモジュールを使っている場合はNoneに置き換える（モジュールはpickleできない）"""
+        state = self.__dict__.copy()
+        if state["_rng"] is random:
+            state["_rng"] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """unpickle時、乱数生成器がNoneならrandomモジュールに戻す"""
+        self.__dict__.update(state)
+        if self._rng is None:
+            self._rng = random
+    
+    def with_rng(self, rng: random.Random) -> "RegionalLifeSimulator":
+        """
+        乱数生成器だけを差し替えたコピーを返す
+        
+        データや早見表は元のインスタンスと共有し、出生・教育・キャリア・死亡・偏差値の
+        すべての乱数を rng から引く。randomモジュールの状態には触れないため、
+        複数スレッドから同時に使っても互いの乱数列に影響しない
+        
+        Args:
+            rng: 乱数生成器
+        
+        Returns:
+            rng を使う RegionalLifeSimulator
+        """
+        simulator = copy.copy(self)
+        simulator._rng = rng
+        for name in ("birth_sim", "education_sim", "career_sim", "death_sim"):
+            sub_simulator = copy.copy(getattr(self, name))
+            sub_simulator._rng = rng
+            setattr(simulator, name, sub_simulator)
+        return simulator
     
     def generate_life(self) -> Dict[str, Any]:
         """
@@ -84,12 +185,98 @@ class RegionalLifeSimulator:
         Returns:
             人生データの辞書
         """
-        from .deviation_value import DeviationValueCalculator
-        
         # 性別と出生地
         gender = self.birth_sim.select_gender()
         birth_city = self.birth_sim.select_birth_city()
         
+        return self._generate_life(gender, birth_city)
+    
+    def generate_lives(self, n: int) -> List[Dict[str, Any]]:
+        """
+        n人の人生をまとめて生成
+        
+        他の項目に依存しない性別・出生地・死亡年齢・最初の就職先産業は全員分を一括で選択してから、
+        1人ずつ残りの人生を生成する
+        
+        Args:
+            n: 生成する人数
+            
+        Returns:
+            人生データの辞書のリスト
+        """
+        genders = self.birth_sim.select_genders(n)
+        birth_cities = self.birth_sim.select_birth_cities(n)
+        death_ages = self.death_sim.select_death_ages(n)
+        
+        # 最初の就職先産業は性別ごとに必要な人数分をまとめて選択
+        first_industries = {
+            gender: iter(self.career_sim.select_industries(genders.count(gender), gender))
+            for gender in dict.fromkeys(genders)
+        }
+        return [
+            self._generate_life(
+                gender,
+                birth_city,
+                death_age=death_age,
+                first_industry=next(first_industries[gender]),
+            )
+            for gender, birth_city, death_age in zip(genders, birth_cities, death_ages)
+        ]
+    
+    def generate_lives_parallel(
+        self,
+        n: int,
+        workers: Optional[int] = None,
+        chunksize: int = 1024,
+    ) -> List[Dict[str, Any]]:
+        """
+        n人の人生を複数プロセスで並列に生成
+        
+        チャンクごとの乱数シードは親プロセスの乱数から決めるため、
+        random.seed() 済みであれば結果は再現可能（ワーカー数にはよらない）
+        
+        Args:
+            n: 生成する人数
+            workers: ワーカープロセス数（Noneの場合はCPU数）
+            chunksize: 1タスクあたりの人数
+        
+        Returns:
+            人生データの辞書のリスト
+        """
+        sizes = [min(chunksize, n - start) for start in range(0, n, chunksize)]
+        seeds = [random.getrandbits(64) for _ in sizes]
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            lives = []
+            for chunk in executor.map(_generate_lives_chunk, seeds, sizes):
+                lives.extend(chunk)
+        return lives
+    
+    def _generate_life(
+        self,
+        gender: str,
+        birth_city: str,
+        death_age: Optional[int] = None,
+        first_industry: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        性別・出生地が決まった状態から1人の人生を生成
+        
+        Args:
+            gender: 性別
+            birth_city: 出生地
+            death_age: 死亡年齢（Noneの場合はここで選択）
+            first_industry: 最初の就職先産業（Noneの場合はここで選択）
+            
+        Returns:
+            人生データの辞書
+        """
+        from .deviation_value import DeviationValueCalculator
+        
         # 世帯年収（出生地に基づく）
         household_income = self.birth_sim.select_household_income(birth_city)
         
@@ -107,6 +294,7 @@ class RegionalLifeSimulator:
             mother_education=mother_education,
             household_income=household_income,
             birth_city=birth_city,
+            rng=self._rng,
         )
         
         # 高校進学（親学歴・世帯年収を考慮）
@@ -126,13 +314,14 @@ class RegionalLifeSimulator:
             )
             # 高校での学力成長をシミュレート
             graduation_deviation = DeviationValueCalculator.simulate_academic_growth(
-                deviation_value, high_school_deviation
+                deviation_value, high_school_deviation, rng=self._rng
             )
         else:
             graduation_deviation = deviation_value
         
         # 大学進学（親学歴・世帯年収・高校偏差値を考慮）
-        went_to_university = self.education_sim.decide_university(
+        # 専門学校・短大進学（大学に進学しなかった高卒者対象）も同じ乱数でまとめて決定
+        went_to_university, went_to_vocational_school = self.education_sim.decide_higher_education(
             birth_city,
             went_to_high_school,
             father_education=father_education,
@@ -152,16 +341,6 @@ class RegionalLifeSimulator:
                     university_destination, graduation_deviation
                 )
         
-        # 専門学校・短大進学（大学に進学しなかった高卒者対象）
-        went_to_vocational_school = self.education_sim.decide_vocational_school(
-            birth_city,
-            went_to_high_school,
-            went_to_university,
-            father_education=father_education,
-            mother_education=mother_education,
-            household_income=household_income
-        )
-
         # 大学院進学（大学に進学した場合のみ）
         went_to_graduate_school = self.education_sim.decide_graduate_school(
             went_to_university=went_to_university,
@@ -218,11 +397,13 @@ class RegionalLifeSimulator:
         retirement_age = self.career_sim.select_retirement_age()
         
         # 死亡
-        death_age = self.death_sim.select_death_age()
+        if death_age is None:
+            death_age = self.death_sim.select_death_age()
         death_cause = self.death_sim.select_death_cause(death_age)
         
         # 最初の就職先産業
-        first_industry = self.career_sim.select_industry(gender)
+        if first_industry is None:
+            first_industry = self.career_sim.select_industry(gender)
         
         # キャリア履歴をシミュレーション
         # 終了年齢は定年または死亡の早い方
@@ -234,13 +415,14 @@ class RegionalLifeSimulator:
         
         # 就業開始年齢が終了年齢より前の場合のみキャリア履歴を生成
         if start_work_age < career_end_age:
-            career_history = self.career_sim.simulate_career_history(
+            career_events = self.career_sim.simulate_career_events(
                 gender=gender,
                 start_age=start_work_age,
                 end_age=career_end_age,
                 first_industry=first_industry,
             )
-            career_summary = self.career_sim.get_career_summary(career_history)
+            career_history = career_events.to_dicts()
+            career_summary = self.career_sim.summarize_career_events(career_events)
         else:
             career_history = []
             career_summary = {
@@ -291,17 +473,18 @@ class RegionalLifeSimulator:
             "death_cause": death_cause,
         }
     
-    def calculate_life_score(self, life: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_life_score(self, life: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
         """
         人生スコアを計算する（最終学歴、生涯年収、寿命の3要素）
         
         Args:
             life: generate_life()で生成された人生データ
+            verbose: Falseの場合はスコア詳細（breakdown）を作らない
             
         Returns:
             スコア結果の辞書
         """
-        return self.scorer.calculate_life_score(life)
+        return self.scorer.calculate_life_score(life, verbose=verbose)
     
     def calculate_parent_gacha_score(self, life: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -363,23 +546,32 @@ class RegionalLifeSimulator:
         Returns:
             フォーマットされた文字列
         """
-        # スコアを計算
-        score_result = None
-        sns_reactions = None
+        # ストーリーのみの場合はスコアを計算せず、表示に使う生涯年収だけ求める
+        if not show_score and not show_sns:
+            lifetime_income = self.scorer.calculate_lifetime_income(life)["total"]
+            return self.formatter.format_life(
+                life=life,
+                show_score=False,
+                verbose_score=verbose_score,
+                show_sns=False,
+                derived={"lifetime_income": lifetime_income},
+            )
         
-        if show_score or show_sns:
-            score_result = self.calculate_life_score(life)
+        # スコアを計算（SNS反応だけならスコア詳細は不要）
+        score_result = self.calculate_life_score(life, verbose=show_score)
+        sns_reactions = None
         
-        if show_sns and score_result:
+        if show_sns:
             sns_reactions = self.generate_sns_reactions(life, score_result)
         
         return self.formatter.format_life(
             life=life,
             score_result=score_result if show_score else None,
-            sns_reactions=sns_reactions if show_sns else None,
+            sns_reactions=sns_reactions,
             show_score=show_score,
             verbose_score=verbose_score,
             show_sns=show_sns,
+            derived=score_result["derived"],
         )
     
     def format_score_breakdown(
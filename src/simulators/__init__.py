@@ -2,12 +2,13 @@
 
 from .birth import BirthSimulator
 from .education import EducationSimulator
-from .career import CareerSimulator
+from .career import CareerSimulator, CareerHistory
 from .death import DeathSimulator
 
 __all__ = [
     "BirthSimulator",
     "EducationSimulator",
     "CareerSimulator",
+    "CareerHistory",
     "DeathSimulator",
 ]
@@ -0,0 +1,85 @@
+"""
+重み付きサンプリングの共通処理
+
+各シミュレーターが使うWalker's alias method（Vose法）のテーブル構築と選択
+"""
+
+from array import array
+from typing import Any, Callable, List, Optional, Tuple
+
+
+# (選択肢タプル, 確率表, 別名表)
+AliasTable = Tuple[tuple, array, array]
+
+
+def build_alias_table(values: List[Any], weights: List[float]) -> Optional[AliasTable]:
+    """
+    Walker's alias method（Vose法）のテーブルを構築
+
+    Args:
+        values: 選択肢のリスト
+        weights: 各選択肢の重み
+
+    Returns:
+        (選択肢タプル, 確率表, 別名表)。重みの合計が0以下の場合はNone
+    """
+    n = len(values)
+    total = sum(weights)
+    if n == 0 or total <= 0:
+        return None
+
+    scaled = [w * n / total for w in weights]
+    prob = array("d", [1.0] * n)
+    alias = array("i", range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = (scaled[l] + scaled[s]) - 1.0
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+
+    # 残りは浮動小数点誤差のみなので確率1.0（自分自身）のまま
+    return tuple(values), prob, alias
+
+
+def sample_alias(table: AliasTable, rand: Callable[[], float]) -> Any:
+    """
+    エイリアステーブルから1件をO(1)で選択
+
+    Args:
+        table: build_alias_table() で構築したテーブル
+        rand: [0, 1) の一様乱数を返す関数（乱数生成器の random メソッド）
+
+    Returns:
+        選択された要素
+    """
+    values, prob, alias = table
+    i = int(rand() * len(values))
+    return values[i] if rand() < prob[i] else values[alias[i]]
+
+
+def sample_alias_many(table: AliasTable, k: int, rand: Callable[[], float]) -> List[Any]:
+    """
+    エイリアステーブルからk件をまとめて選択
+
+    Args:
+        table: build_alias_table() で構築したテーブル
+        k: 選択する件数
+        rand: [0, 1) の一様乱数を返す関数（乱数生成器の random メソッド）
+
+    Returns:
+        選択された要素のリスト
+    """
+    values, prob, alias = table
+    n = len(values)
+    return [
+        values[i] if rand() < prob[i] else values[alias[i]]
+        for i in (int(rand() * n) for _ in range(k))
+    ]
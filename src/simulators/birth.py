@@ -5,8 +5,12 @@
 """
 
 import random
+from bisect import bisect_left
+from itertools import accumulate
 from typing import Dict, List, Any, Optional, Tuple
 
+from ._sampling import AliasTable, build_alias_table, sample_alias, sample_alias_many
+
 
 class BirthSimulator:
     """出生に関するシミュレーションを担当するクラス"""
@@ -20,6 +24,7 @@ class BirthSimulator:
         income_by_city: Optional[Dict[str, List[Dict[str, Any]]]] = None,
         education_level_by_gender: Optional[Dict[str, List[Dict[str, Any]]]] = None,
         region: str = "hokkaido",
+        rng: Optional[random.Random] = None,
     ):
         """
         初期化
@@ -32,6 +37,8 @@ class BirthSimulator:
             income_by_city: 市町村別世帯年収分布
             education_level_by_gender: 性別別最終学歴分布
             region: 地域識別子 ("hokkaido" または "tokyo")
+            rng: 乱数生成器（Noneの場合はrandomモジュールの関数をそのまま使い、
+                 random.seed() による再現性を保つ）
         """
         self.birth_data = birth_data
         self.workers_by_gender = workers_by_gender
@@ -40,50 +47,123 @@ class BirthSimulator:
         self.income_by_city = income_by_city or {}
         self.education_level_by_gender = education_level_by_gender or {}
         self.region = region
+        self._rng = rng if rng is not None else random
+        
+        # 重み付き選択用のエイリアステーブルを事前構築（サンプリングをO(1)にする）
+        # 出生地は「札幌市○○区」への変換も構築時に済ませておく
+        self._birth_cities_normalized = tuple(
+            self._normalize_city(item["city"]) for item in self.birth_data
+        )
+        self._city_alias = build_alias_table(
+            list(self._birth_cities_normalized),
+            [item["count"] for item in self.birth_data],
+        )
+        self._gender_alias = build_alias_table(
+            list(self.workers_by_gender.keys()),
+            list(self.workers_by_gender.values()),
+        )
+        self._industry_alias = build_alias_table(
+            [item["industry"] for item in self.workers_by_industry],
+            [item["count"] for item in self.workers_by_industry],
+        )
+        self._industry_alias_by_gender = {}
+        for gender in ("男性", "女性"):
+            industries = []
+            counts = []
+            for industry, gender_data in self.workers_by_industry_gender.items():
+                count = gender_data.get(gender, 0)
+                if count > 0:
+                    industries.append(industry)
+                    counts.append(count)
+            self._industry_alias_by_gender[gender] = build_alias_table(industries, counts)
+        
+        # 世帯年収は市町村ごとに補正済みの累積度数を並列配列で持つ（二分探索で選択する）
+        self._household_income_tables = {
+            city: self._build_household_income_table(income_distribution)
+            for city, income_distribution in self.income_by_city.items()
+        }
+        
+        # 親の学歴は性別ごとに (学歴, 累積比率) を用意しておく（random.choicesのcum_weightsに渡す）
+        self._parent_education_cum = {
+            gender: (
+                tuple(item["education"] for item in education_data),
+                tuple(accumulate(item["ratio"] for item in education_data)),
+            )
+            for gender, education_data in self.education_level_by_gender.items()
+            if education_data
+        }
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """pickle時、randomモジュールを使っている場合はNoneに置き換える（モジュールはpickleできない）"""
+        state = self.__dict__.copy()
+        if state["_rng"] is random:
+            state["_rng"] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """unpickle時、乱数生成器がNoneならrandomモジュールに戻す"""
+        self.__dict__.update(state)
+        if self._rng is None:
+            self._rng = random
+    
+    def _normalize_city(self, city: str) -> str:
+        """北海道の場合のみ、札幌市の区を「札幌市○○区」の形式に変換"""
+        if self.region == "hokkaido" and city.endswith("区") and "市" not in city:
+            return f"札幌市{city}"
+        return city
+    
+    def _sample_alias(self, table: AliasTable) -> Any:
+        """エイリアステーブルから1件をO(1)で選択"""
+        return sample_alias(table, self._rng.random)
+    
+    def _sample_alias_many(self, table: AliasTable, k: int) -> List[Any]:
+        """エイリアステーブルからk件をまとめて選択"""
+        return sample_alias_many(table, k, self._rng.random)
     
     def select_birth_city(self) -> str:
         """出生地をランダムに選択（出生数に基づく重み付き選択）"""
         if not self.birth_data:
             return "不明"
         
-        total_births = sum(item["count"] for item in self.birth_data)
-        if total_births == 0:
-            return random.choice(self.birth_data)["city"] if self.birth_data else "不明"
+        if self._city_alias is None:
+            return self._rng.choice(self._birth_cities_normalized)
         
-        rand = random.uniform(0, total_births)
-        cumulative = 0
-        for item in self.birth_data:
-            cumulative += item["count"]
-            if rand <= cumulative:
-                city = item["city"]
-                # 北海道の場合のみ、札幌市の区を「札幌市○○区」の形式に変換
-                if self.region == "hokkaido" and city.endswith("区") and "市" not in city:
-                    city = f"札幌市{city}"
-                return city
-        
-        # 最後の要素も同様に処理
-        city = self.birth_data[-1]["city"]
-        if self.region == "hokkaido" and city.endswith("区") and "市" not in city:
-            city = f"札幌市{city}"
-        return city
+        return self._sample_alias(self._city_alias)
     
     def select_gender(self) -> str:
         """性別をランダムに選択（労働者数に基づく重み付き選択）"""
-        if not self.workers_by_gender:
-            return random.choice(["男性", "女性"])
+        if self._gender_alias is None:
+            return self._rng.choice(["男性", "女性"])
         
-        total = sum(self.workers_by_gender.values())
-        if total == 0:
-            return random.choice(["男性", "女性"])
+        return self._sample_alias(self._gender_alias)
+    
+    def select_birth_cities(self, k: int) -> List[str]:
+        """
+        出生地をk人分まとめて選択（複数人の一括生成用）
         
-        rand = random.uniform(0, total)
-        cumulative = 0
-        for gender, count in self.workers_by_gender.items():
-            cumulative += count
-            if rand <= cumulative:
-                return gender
+        Args:
+            k: 人数
+            
+        Returns:
+            出生地のリスト
+        """
+        if self._city_alias is None:
+            return [self.select_birth_city() for _ in range(k)]
+        return self._sample_alias_many(self._city_alias, k)
+    
+    def select_genders(self, k: int) -> List[str]:
+        """
+        性別をk人分まとめて選択（複数人の一括生成用）
         
-        return "男性"
+        Args:
+            k: 人数
+            
+        Returns:
+            性別のリスト
+        """
+        if self._gender_alias is None:
+            return [self.select_gender() for _ in range(k)]
+        return self._sample_alias_many(self._gender_alias, k)
     
     def select_parent_industry(self, gender: str) -> str:
         """
@@ -96,40 +176,18 @@ class BirthSimulator:
             産業名
         """
         # 性別×産業データがある場合
-        if self.workers_by_industry_gender:
-            industry_weights = []
-            for industry, gender_data in self.workers_by_industry_gender.items():
-                count = gender_data.get(gender, 0)
-                if count > 0:
-                    industry_weights.append({"industry": industry, "count": count})
-            
-            if industry_weights:
-                total_workers = sum(item["count"] for item in industry_weights)
-                if total_workers > 0:
-                    rand = random.uniform(0, total_workers)
-                    cumulative = 0
-                    for item in industry_weights:
-                        cumulative += item["count"]
-                        if rand <= cumulative:
-                            return item["industry"]
-                    return industry_weights[-1]["industry"]
+        table = self._industry_alias_by_gender.get(gender)
+        if table is not None:
+            return self._sample_alias(table)
         
         # 性別データがない場合は全体データを使用
         if not self.workers_by_industry:
             return "不明"
         
-        total_workers = sum(item["count"] for item in self.workers_by_industry)
-        if total_workers == 0:
-            return random.choice(self.workers_by_industry)["industry"] if self.workers_by_industry else "不明"
-        
-        rand = random.uniform(0, total_workers)
-        cumulative = 0
-        for item in self.workers_by_industry:
-            cumulative += item["count"]
-            if rand <= cumulative:
-                return item["industry"]
+        if self._industry_alias is None:
+            return self._rng.choice(self.workers_by_industry)["industry"]
         
-        return self.workers_by_industry[-1]["industry"]
+        return self._sample_alias(self._industry_alias)
     
     # 児童のいる世帯向け年収補正係数
     # 全世帯データには高齢者世帯（年金生活者）が含まれ低年収層が多くなる
@@ -157,6 +215,35 @@ class BirthSimulator:
         "400〜600万円": 1.20,
     }
     
+    # 学歴データがない場合のデフォルト（学歴, 累積比率）
+    # 中学校8.0%、高校43.0%、短大・専門学校19.0%、大学27.5%、大学院2.5%
+    DEFAULT_PARENT_EDUCATION_CUM = (
+        ("中学校", "高校", "短大・専門学校", "大学", "大学院"),
+        tuple(accumulate((8.0, 43.0, 19.0, 27.5, 2.5))),
+    )
+    
+    def _build_household_income_table(
+        self,
+        income_distribution: List[Dict[str, Any]],
+    ) -> Optional[Tuple[tuple, List[float], float]]:
+        """
+        児童のいる世帯向けに補正した世帯年収の累積度数テーブルを構築
+        
+        Args:
+            income_distribution: 年収階級ごとの世帯数（{"range", "count"}のリスト）
+        
+        Returns:
+            (年収レンジ, 累積度数, 合計) のタプル。データが空ならNone
+        """
+        if not income_distribution:
+            return None
+        ranges = tuple(item["range"] for item in income_distribution)
+        adjusted_counts = [
+            item["count"] * self.CHILD_HOUSEHOLD_INCOME_ADJUSTMENT.get(item["range"], 1.0)
+            for item in income_distribution
+        ]
+        return ranges, list(accumulate(adjusted_counts)), sum(adjusted_counts)
+    
     def select_household_income(self, city: str) -> str:
         """
         世帯年収レンジを選択（児童のいる世帯向けに補正）
@@ -170,53 +257,25 @@ class BirthSimulator:
         Returns:
             年収レンジの文字列（例: "300〜400万円"）
         """
-        # 市町村名の正規化（「札幌市○○区」→「札幌市○○区」）
-        normalized_city = city
-        
-        # 札幌市の区の場合、そのまま検索
-        if "札幌市" in city:
-            normalized_city = city
-        
-        # 該当市町村のデータを取得
-        income_distribution = self.income_by_city.get(normalized_city)
+        # 該当市町村のデータを取得（札幌市の区はそのまま検索）
+        table = self._household_income_tables.get(city)
         
         # 見つからない場合はデフォルト分布を使用
-        if not income_distribution:
+        if not table:
             default_key = "北海道（デフォルト）" if self.region == "hokkaido" else "東京都（デフォルト）"
-            income_distribution = self.income_by_city.get(default_key)
+            table = self._household_income_tables.get(default_key)
         
         # それでも見つからない場合はデフォルト値を返す
-        if not income_distribution:
+        if not table:
             return "400〜500万円"  # 児童世帯の中央値付近
         
-        # 児童のいる世帯向けに補正係数を適用
-        adjusted_distribution = []
-        for item in income_distribution:
-            income_range = item["range"]
-            original_count = item["count"]
-            
-            # 補正係数を取得（デフォルトは1.0）
-            adjustment = self.CHILD_HOUSEHOLD_INCOME_ADJUSTMENT.get(income_range, 1.0)
-            adjusted_count = original_count * adjustment
-            
-            adjusted_distribution.append({
-                "range": income_range,
-                "count": adjusted_count
-            })
-        
-        # 重み付き選択
-        total_count = sum(item["count"] for item in adjusted_distribution)
+        # 重み付き選択（累積度数を二分探索）
+        ranges, cumulative, total_count = table
         if total_count == 0:
             return "400〜500万円"
         
-        rand = random.uniform(0, total_count)
-        cumulative = 0
-        for item in adjusted_distribution:
-            cumulative += item["count"]
-            if rand <= cumulative:
-                return item["range"]
-        
-        return adjusted_distribution[-1]["range"]
+        index = bisect_left(cumulative, self._rng.random() * total_count)
+        return ranges[min(index, len(ranges) - 1)]
     
     def select_parent_education(self, gender: str) -> str:
         """
@@ -228,30 +287,13 @@ class BirthSimulator:
         Returns:
             最終学歴（例: "高校", "大学" など）
         """
-        # 性別の学歴データを取得
-        education_data = self.education_level_by_gender.get(gender)
-        
-        if not education_data:
-            # データがない場合はデフォルト値を使用
-            default_data = [
-                {"education": "中学校", "ratio": 8.0},
-                {"education": "高校", "ratio": 43.0},
-                {"education": "短大・専門学校", "ratio": 19.0},
-                {"education": "大学", "ratio": 27.5},
-                {"education": "大学院", "ratio": 2.5},
-            ]
-            education_data = default_data
+        # 性別の学歴データを取得（データがない場合はデフォルト値を使用）
+        educations, cum_ratios = self._parent_education_cum.get(
+            gender, self.DEFAULT_PARENT_EDUCATION_CUM
+        )
         
         # 重み付き選択
-        total_ratio = sum(item["ratio"] for item in education_data)
-        if total_ratio == 0:
+        if not cum_ratios or cum_ratios[-1] <= 0:
             return "高校"
         
-        rand = random.uniform(0, total_ratio)
-        cumulative = 0
-        for item in education_data:
-            cumulative += item["ratio"]
-            if rand <= cumulative:
-                return item["education"]
-        
-        return education_data[-1]["education"]
+        return self._rng.choices(educations, cum_weights=cum_ratios)[0]
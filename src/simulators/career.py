@@ -8,9 +8,15 @@
 """
 
 import csv
+import math
 import random
+import sys
+from array import array
+from collections import namedtuple
+from dataclasses import dataclass, field
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from ..constants import (
     COMPANY_SIZE_DISTRIBUTION_BY_EDUCATION,
@@ -22,33 +28,89 @@ from ..constants import (
 )
 
 
+# 年齢階級ごとの転職率・離職率・再就職率（%）
+JobMobilityRates = namedtuple(
+    "JobMobilityRates",
+    [
+        "age_min", "age_max",
+        "male_job_change_rate", "female_job_change_rate",
+        "male_separation_rate", "female_separation_rate",
+        "male_reemployment_rate", "female_reemployment_rate",
+    ],
+)
+
 # デフォルトの転職・離職率データ（CSVがない場合に使用）
-DEFAULT_JOB_MOBILITY_DATA = [
-    {"age_min": 20, "age_max": 24, "male_job_change_rate": 14.6, "female_job_change_rate": 14.1,
-     "male_separation_rate": 15.2, "female_separation_rate": 17.2,
-     "male_reemployment_rate": 70, "female_reemployment_rate": 60},
-    {"age_min": 25, "age_max": 29, "male_job_change_rate": 13.4, "female_job_change_rate": 13.4,
-     "male_separation_rate": 13.4, "female_separation_rate": 17.1,
-     "male_reemployment_rate": 70, "female_reemployment_rate": 55},
-    {"age_min": 30, "age_max": 34, "male_job_change_rate": 9.4, "female_job_change_rate": 11.8,
-     "male_separation_rate": 9.4, "female_separation_rate": 15.3,
-     "male_reemployment_rate": 65, "female_reemployment_rate": 45},
-    {"age_min": 35, "age_max": 39, "male_job_change_rate": 7.4, "female_job_change_rate": 10.5,
-     "male_separation_rate": 7.5, "female_separation_rate": 12.0,
-     "male_reemployment_rate": 60, "female_reemployment_rate": 45},
-    {"age_min": 40, "age_max": 44, "male_job_change_rate": 5.9, "female_job_change_rate": 9.8,
-     "male_separation_rate": 6.0, "female_separation_rate": 10.0,
-     "male_reemployment_rate": 55, "female_reemployment_rate": 50},
-    {"age_min": 45, "age_max": 49, "male_job_change_rate": 5.2, "female_job_change_rate": 9.4,
-     "male_separation_rate": 5.5, "female_separation_rate": 9.4,
-     "male_reemployment_rate": 50, "female_reemployment_rate": 55},
-    {"age_min": 50, "age_max": 54, "male_job_change_rate": 4.8, "female_job_change_rate": 8.9,
-     "male_separation_rate": 5.4, "female_separation_rate": 8.9,
-     "male_reemployment_rate": 45, "female_reemployment_rate": 60},
-    {"age_min": 55, "age_max": 59, "male_job_change_rate": 5.5, "female_job_change_rate": 8.7,
-     "male_separation_rate": 7.1, "female_separation_rate": 8.8,
-     "male_reemployment_rate": 40, "female_reemployment_rate": 55},
-]
+# 列: 年齢下限, 年齢上限, 転職率(男/女), 離職率(男/女), 再就職率(男/女)
+DEFAULT_JOB_MOBILITY_DATA = (
+    JobMobilityRates(20, 24, 14.6, 14.1, 15.2, 17.2, 70, 60),
+    JobMobilityRates(25, 29, 13.4, 13.4, 13.4, 17.1, 70, 55),
+    JobMobilityRates(30, 34, 9.4, 11.8, 9.4, 15.3, 65, 45),
+    JobMobilityRates(35, 39, 7.4, 10.5, 7.5, 12.0, 60, 45),
+    JobMobilityRates(40, 44, 5.9, 9.8, 6.0, 10.0, 55, 50),
+    JobMobilityRates(45, 49, 5.2, 9.4, 5.5, 9.4, 50, 55),
+    JobMobilityRates(50, 54, 4.8, 8.9, 5.4, 8.9, 45, 60),
+    JobMobilityRates(55, 59, 5.5, 8.7, 7.1, 8.8, 40, 55),
+)
+
+
+# 転職・再就職先の産業をまとめて選択しておく件数（1人あたりの平均は4〜5件程度）
+INDUSTRY_POOL_SIZE = 8
+
+
+# 定年年齢カテゴリ → 定年年齢（タプルは範囲、Noneは定年なし）
+RETIREMENT_AGE_BY_CATEGORY = {
+    "60歳": 60,
+    "61-64歳": (61, 64),
+    "65歳": 65,
+    "66歳以上": (66, 75),
+    "定年なし": None,
+}
+
+
+# キャリアイベントの種類コード（CareerHistory.typesに格納する値）
+EVENT_TYPE_HIRE = 0  # 就職
+EVENT_TYPE_CHANGE = 1  # 転職
+EVENT_TYPE_SEPARATION = 2  # 離職
+EVENT_TYPE_REEMPLOYMENT = 3  # 再就職
+
+# 種類コード → 表示用の名称
+EVENT_TYPE_NAMES = ("就職", "転職", "離職", "再就職")
+
+
+@dataclass
+class CareerHistory:
+    """キャリア履歴を項目ごとの並列リストで保持するデータクラス
+    
+    i番目のイベントは各リストのi番目の要素からなる（該当しない項目はNone）
+    """
+    ages: List[int] = field(default_factory=list)
+    types: array = field(default_factory=lambda: array("B"))  # EVENT_TYPE_* のコード
+    industries: List[str] = field(default_factory=list)
+    previous_industries: List[Optional[str]] = field(default_factory=list)
+    company_numbers: List[Optional[int]] = field(default_factory=list)
+    unemployment_durations: List[Optional[int]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.ages)
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """i番目のイベントを従来と同じキーを持つ辞書として取得"""
+        result = {
+            "age": self.ages[index],
+            "type": EVENT_TYPE_NAMES[self.types[index]],
+            "industry": self.industries[index],
+        }
+        if self.previous_industries[index] is not None:
+            result["previous_industry"] = self.previous_industries[index]
+        if self.company_numbers[index] is not None:
+            result["company_number"] = self.company_numbers[index]
+        if self.unemployment_durations[index] is not None:
+            result["unemployment_duration"] = self.unemployment_durations[index]
+        return result
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """キャリアイベントの辞書のリストに変換"""
+        return [self[i] for i in range(len(self))]
 
 
 class CareerSimulator:
@@ -60,6 +122,7 @@ class CareerSimulator:
         workers_by_industry_gender: Dict[str, Dict[str, int]],
         retirement_age_distribution: List[Dict[str, Any]],
         job_mobility_data: Optional[List[Dict[str, Any]]] = None,
+        rng: Optional[random.Random] = None,
     ):
         """
         初期化
@@ -68,12 +131,124 @@ class CareerSimulator:
             workers_by_industry: 産業別労働者数データ
             workers_by_industry_gender: 性別×産業別労働者数
             retirement_age_distribution: 定年年齢分布
-            job_mobility_data: 転職・離職率データ（Noneの場合はデフォルト使用）
+            job_mobility_data: 転職・離職率データ（辞書またはJobMobilityRatesのリスト。
+                               Noneの場合はデフォルト使用）
+            rng: 乱数生成器（Noneの場合はrandomモジュールの関数をそのまま使い、
+                 random.seed() による再現性を保つ）
         """
         self.workers_by_industry = workers_by_industry
         self.workers_by_industry_gender = workers_by_industry_gender
         self.retirement_age_distribution = retirement_age_distribution
-        self.job_mobility_data = job_mobility_data or DEFAULT_JOB_MOBILITY_DATA
+        self.job_mobility_data = tuple(
+            self._to_job_mobility_rates(data)
+            for data in (job_mobility_data or DEFAULT_JOB_MOBILITY_DATA)
+        )
+        self._rng = rng if rng is not None else random
+        
+        # 年齢 → 転職率・離職率・再就職率の早見表（性別・率の種類ごと）
+        self._rate_tables: Dict[str, Tuple[List[float], float]] = {
+            f"{gender_prefix}_{rate_type}_rate": self._build_rate_table(f"{gender_prefix}_{rate_type}_rate")
+            for gender_prefix in ("male", "female")
+            for rate_type in ("job_change", "separation", "reemployment")
+        }
+        
+        # 就業中に転職または離職が起きる年率（%）と、その率が変わる年齢の早見表（性別ごと）
+        self._employed_event_tables: Dict[str, Tuple[List[float], float, List[int]]] = {}
+        for gender_prefix in ("male", "female"):
+            job_change_table, job_change_fallback = self._rate_tables[f"{gender_prefix}_job_change_rate"]
+            separation_table, separation_fallback = self._rate_tables[f"{gender_prefix}_separation_rate"]
+            event_table = [
+                self._employed_event_rate(job_change_rate, separation_rate)
+                for job_change_rate, separation_rate in zip(job_change_table, separation_table)
+            ]
+            self._employed_event_tables[gender_prefix] = (
+                event_table,
+                self._employed_event_rate(job_change_fallback, separation_fallback),
+                # 転職率が変わる年齢でも区切る（転職か離職かの内訳が変わるため）
+                self._build_segment_ends(list(zip(job_change_table, event_table))),
+            )
+        
+        # 無職の期間に再就職が起きる年率（%）と、その率が変わる年齢の早見表（性別ごと）
+        self._reemployment_event_tables: Dict[str, Tuple[List[float], float, List[int]]] = {}
+        for gender_prefix in ("male", "female"):
+            reemployment_table, reemployment_fallback = self._rate_tables[f"{gender_prefix}_reemployment_rate"]
+            self._reemployment_event_tables[gender_prefix] = (
+                reemployment_table,
+                reemployment_fallback,
+                self._build_segment_ends(reemployment_table),
+            )
+        
+        # 産業の累積重み（性別ごと、および全体）。労働者数0の産業は除く
+        # 産業名はsys.internで1つの文字列オブジェクトにまとめ、選択結果はこのタプルの要素を返す
+        self._industry_tables_by_gender: Dict[str, Tuple[tuple, List[float], float]] = {}
+        for gender in ("男性", "女性"):
+            distribution = {}
+            for industry, gender_data in (self.workers_by_industry_gender or {}).items():
+                count = gender_data.get(gender, 0)
+                if count > 0:
+                    distribution[sys.intern(industry)] = count
+            if distribution:
+                self._industry_tables_by_gender[gender] = self._build_cumulative_table(distribution)
+        workers_by_industry = self.workers_by_industry or []
+        self._industry_table = (
+            tuple(sys.intern(item["industry"]) for item in workers_by_industry),
+            list(accumulate(item["count"] for item in workers_by_industry)),
+            sum(item["count"] for item in workers_by_industry),
+        )
+        
+        # 企業規模・雇用形態の累積重み（学歴などの組み合わせごとに初回だけ構築）
+        self._company_size_tables: Dict[tuple, Tuple[tuple, List[float], float]] = {}
+        self._employment_type_tables: Dict[tuple, Tuple[tuple, List[float], float]] = {}
+        
+        # 定年年齢カテゴリの累積比率
+        retirement_distribution = self.retirement_age_distribution or []
+        self._retirement_table = (
+            tuple(item["category"] for item in retirement_distribution),
+            list(accumulate(item["ratio"] for item in retirement_distribution)),
+            sum(item["ratio"] for item in retirement_distribution),
+        )
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """pickle時、randomモジュールを使っている場合はNoneに置き換える（モジュールはpickleできない）"""
+        state = self.__dict__.copy()
+        if state["_rng"] is random:
+            state["_rng"] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """unpickle時、乱数生成器がNoneならrandomモジュールに戻す"""
+        self.__dict__.update(state)
+        if self._rng is None:
+            self._rng = random
+    
+    @staticmethod
+    def _build_cumulative_table(distribution: Dict[str, float]) -> Tuple[tuple, List[float], float]:
+        """
+        {選択肢: 重み} の辞書から (選択肢, 累積重み, 合計) を構築
+        
+        Args:
+            distribution: 選択肢ごとの重み
+        
+        Returns:
+            (選択肢のタプル, 累積重みのリスト, 重みの合計)
+        """
+        return (
+            tuple(distribution.keys()),
+            list(accumulate(distribution.values())),
+            sum(distribution.values()),
+        )
+    
+    def _select_from_table(self, table: Tuple[tuple, List[float], float]) -> Any:
+        """
+        累積重みテーブルから重み付きランダム選択（random.choicesのcum_weightsを使用）
+        
+        Args:
+            table: _build_cumulative_table()で構築したテーブル（重みの合計は正であること）
+        
+        Returns:
+            選択された値
+        """
+        return self._rng.choices(table[0], cum_weights=table[1])[0]
     
     def select_industry(self, gender: Optional[str] = None) -> str:
         """
@@ -86,40 +261,38 @@ class CareerSimulator:
             産業名
         """
         # 性別が指定されていて、性別×産業データがある場合
-        if gender and self.workers_by_industry_gender:
-            industry_weights = []
-            for industry, gender_data in self.workers_by_industry_gender.items():
-                count = gender_data.get(gender, 0)
-                if count > 0:
-                    industry_weights.append({"industry": industry, "count": count})
-            
-            if industry_weights:
-                total_workers = sum(item["count"] for item in industry_weights)
-                if total_workers > 0:
-                    rand = random.uniform(0, total_workers)
-                    cumulative = 0
-                    for item in industry_weights:
-                        cumulative += item["count"]
-                        if rand <= cumulative:
-                            return item["industry"]
-                    return industry_weights[-1]["industry"]
+        if gender:
+            table = self._industry_tables_by_gender.get(gender)
+            if table is not None:
+                return self._select_from_table(table)
         
         # 性別データがない場合は従来の全体データを使用
         if not self.workers_by_industry:
             return "不明"
         
-        total_workers = sum(item["count"] for item in self.workers_by_industry)
+        industries, _, total_workers = self._industry_table
         if total_workers == 0:
-            return random.choice(self.workers_by_industry)["industry"] if self.workers_by_industry else "不明"
+            return self._rng.choice(industries)
         
-        rand = random.uniform(0, total_workers)
-        cumulative = 0
-        for item in self.workers_by_industry:
-            cumulative += item["count"]
-            if rand <= cumulative:
-                return item["industry"]
+        return self._select_from_table(self._industry_table)
+    
+    def select_industries(self, n: int, gender: Optional[str] = None) -> List[str]:
+        """
+        就職先の産業をn人分まとめて選択（複数人の一括生成用）
+        
+        Args:
+            n: 人数
+            gender: 性別（指定された場合、性別に応じた産業分布を使用）
         
-        return self.workers_by_industry[-1]["industry"]
+        Returns:
+            産業名のリスト
+        """
+        table = self._industry_tables_by_gender.get(gender) if gender else None
+        if table is None:
+            table = self._industry_table
+            if table[2] == 0:
+                return [self.select_industry(gender) for _ in range(n)]
+        return self._rng.choices(table[0], cum_weights=table[1], k=n)
     
     def select_retirement_age(self) -> Optional[int]:
         """
@@ -131,32 +304,142 @@ class CareerSimulator:
         if not self.retirement_age_distribution:
             return 60  # デフォルト
         
-        total_ratio = sum(item["ratio"] for item in self.retirement_age_distribution)
-        if total_ratio == 0:
+        if self._retirement_table[2] == 0:
             return 60
         
-        rand = random.uniform(0, total_ratio)
-        cumulative = 0
-        for item in self.retirement_age_distribution:
-            cumulative += item["ratio"]
-            if rand <= cumulative:
-                category = item["category"]
-                
-                # カテゴリに応じて具体的な年齢を返す
-                if category == "60歳":
-                    return 60
-                elif category == "61-64歳":
-                    return random.randint(61, 64)
-                elif category == "65歳":
-                    return 65
-                elif category == "66歳以上":
-                    return random.randint(66, 75)
-                elif category == "定年なし":
-                    return None  # 定年なし
-                else:
-                    return 60
+        category = self._select_from_table(self._retirement_table)
+        
+        # カテゴリに応じて具体的な年齢を返す（範囲のカテゴリはその中から一様に選ぶ）
+        age = RETIREMENT_AGE_BY_CATEGORY.get(category, 60)
+        if isinstance(age, tuple):
+            return self._rng.randint(*age)
+        return age
+    
+    @staticmethod
+    def _to_job_mobility_rates(data: Any) -> JobMobilityRates:
+        """
+        転職・離職率データの1行をJobMobilityRatesに変換
+        
+        Args:
+            data: 辞書またはJobMobilityRates（辞書に率がない場合は5.0%とする）
+        
+        Returns:
+            JobMobilityRates
+        """
+        if isinstance(data, JobMobilityRates):
+            return data
+        return JobMobilityRates(
+            int(data["age_min"]),
+            int(data["age_max"]),
+            *(data.get(field_name, 5.0) for field_name in JobMobilityRates._fields[2:]),
+        )
+    
+    def _build_rate_table(self, rate_key: str) -> Tuple[List[float], float]:
+        """
+        年齢をインデックスとした率の早見表を構築
+        
+        Args:
+            rate_key: 率のキー（例: "male_job_change_rate"）
+        
+        Returns:
+            (年齢ごとの率のリスト, 表の範囲外の年齢に使う率)
+        """
+        # 範囲外の場合は最後のデータを使用
+        if self.job_mobility_data:
+            fallback = getattr(self.job_mobility_data[-1], rate_key)
+        else:
+            fallback = 5.0  # デフォルト
+        
+        max_age = max((data.age_max for data in self.job_mobility_data), default=-1)
+        table: List[Optional[float]] = [None] * (max_age + 1)
+        for data in self.job_mobility_data:
+            rate = getattr(data, rate_key)
+            for age in range(max(0, data.age_min), data.age_max + 1):
+                # 年齢階級が重なる場合は先に現れたデータを優先
+                if table[age] is None:
+                    table[age] = rate
+        return [fallback if rate is None else rate for rate in table], fallback
+    
+    @staticmethod
+    def _employed_event_rate(job_change_rate: float, separation_rate: float) -> float:
+        """
+        就業中に1年間で転職または離職（無職になる）が起きる率（%）
+        
+        Args:
+            job_change_rate: 転職率（%）
+            separation_rate: 離職率（%）。転職率を超える分が純粋な離職
+        
+        Returns:
+            転職率 + 純粋な離職率（100%が上限）
+        """
+        return min(100, job_change_rate + max(0, separation_rate - job_change_rate))
+    
+    @staticmethod
+    def _build_segment_ends(values: List[Any]) -> List[int]:
+        """
+        各年齢について、値が同じまま続く区間の終わり（次に値が変わる年齢）を求める
         
-        return 60
+        Args:
+            values: 年齢をインデックスとした値のリスト
+        
+        Returns:
+            年齢をインデックスとした区間の終わりの年齢のリスト
+        """
+        segment_ends = [len(values)] * len(values)
+        for age in range(len(values) - 2, -1, -1):
+            if values[age] == values[age + 1]:
+                segment_ends[age] = segment_ends[age + 1]
+            else:
+                segment_ends[age] = age + 1
+        return segment_ends
+    
+    def _draw_event_age(
+        self,
+        age: int,
+        end_age: int,
+        rate_table: List[float],
+        fallback_rate: float,
+        segment_ends: List[int],
+    ) -> int:
+        """
+        年率（%）に従って、age歳以降で最初にイベントが起きる年齢を求める
+        
+        毎年判定する代わりに、率が一定の区間ごとに「何年後に起きるか」を
+        幾何分布から1回の乱数で求めて読み飛ばす（毎年判定するのと同じ分布）
+        
+        Args:
+            age: 判定を始める年齢
+            end_age: 終了年齢（この年齢の前年まで判定する）
+            rate_table: 年齢をインデックスとした年率の早見表
+            fallback_rate: 早見表の範囲外の年齢に使う年率
+            segment_ends: rate_tableの率が変わる年齢（_build_segment_ends()の戻り値）
+        
+        Returns:
+            イベントが起きる年齢（end_ageまでに起きない場合はend_age）
+        """
+        rand = self._rng.random
+        table_size = len(rate_table)
+        
+        while age < end_age:
+            if 0 <= age < table_size:
+                rate = rate_table[age]
+                segment_end = min(segment_ends[age], end_age)
+            else:
+                rate = fallback_rate
+                segment_end = min(0, end_age) if age < 0 else end_age
+            
+            if rate >= 100:
+                return age
+            if rate > 0:
+                # 起きるまでに経過する年数（0年後 = この年に起きる）
+                event_age = age + int(math.log(1.0 - rand()) / math.log(1.0 - rate / 100))
+                if event_age < segment_end:
+                    return event_age
+            
+            # この区間では起きない（率が0なら乱数を使わずに区間の終わりまで進める）
+            age = segment_end
+        
+        return end_age
     
     def _get_rate_for_age(self, age: int, gender: str, rate_type: str) -> float:
         """
@@ -171,16 +454,8 @@ class CareerSimulator:
             該当年齢の率（%）
         """
         gender_prefix = "male" if gender == "男性" else "female"
-        rate_key = f"{gender_prefix}_{rate_type}_rate"
-        
-        for data in self.job_mobility_data:
-            if data["age_min"] <= age <= data["age_max"]:
-                return data.get(rate_key, 5.0)
-        
-        # 範囲外の場合は最後のデータを使用
-        if self.job_mobility_data:
-            return self.job_mobility_data[-1].get(rate_key, 5.0)
-        return 5.0  # デフォルト
+        table, fallback = self._rate_tables[f"{gender_prefix}_{rate_type}_rate"]
+        return table[age] if 0 <= age < len(table) else fallback
     
     def simulate_career_history(
         self,
@@ -201,75 +476,131 @@ class CareerSimulator:
         Returns:
             キャリアイベントのリスト
         """
-        events = []
+        return self.simulate_career_events(gender, start_age, end_age, first_industry).to_dicts()
+    
+    def simulate_career_events(
+        self,
+        gender: str,
+        start_age: int,
+        end_age: int,
+        first_industry: str,
+    ) -> CareerHistory:
+        """
+        キャリア履歴のシミュレーション本体（イベントを項目ごとの並列リストで返す）
+        
+        Args:
+            gender: "男性" または "女性"
+            start_age: 就業開始年齢
+            end_age: 終了年齢（定年または死亡年齢の小さい方）
+            first_industry: 最初の就職先産業
+        
+        Returns:
+            キャリア履歴（CareerHistory）
+        """
+        rand = self._rng.random
+        select_industries = self.select_industries
+        draw_event_age = self._draw_event_age
+        
+        # 年齢ごとの率の早見表（範囲外の年齢はfallbackの率）
+        gender_prefix = "male" if gender == "男性" else "female"
+        job_change_table, job_change_fallback = self._rate_tables[f"{gender_prefix}_job_change_rate"]
+        event_table, event_fallback, event_segment_ends = self._employed_event_tables[gender_prefix]
+        reemployment_table, reemployment_fallback, reemployment_segment_ends = (
+            self._reemployment_event_tables[gender_prefix]
+        )
+        table_size = len(job_change_table)
+        
+        # 転職・再就職先の産業は最初のイベントでまとめて選択し、使い切ったら補充する
+        industry_pool: List[str] = []
+        
         current_company = 1
         current_industry = first_industry
         is_employed = True
         unemployment_start_age = None
         
         # 最初の就職イベントを記録
-        events.append({
-            "age": start_age,
-            "type": "就職",
-            "industry": current_industry,
-            "company_number": current_company,
-        })
-        
-        for age in range(start_age, end_age):
+        history = CareerHistory(
+            ages=[start_age],
+            types=array("B", (EVENT_TYPE_HIRE,)),
+            industries=[current_industry],
+            previous_industries=[None],
+            company_numbers=[current_company],
+            unemployment_durations=[None],
+        )
+        append_age = history.ages.append
+        append_type = history.types.append
+        append_industry = history.industries.append
+        append_previous_industry = history.previous_industries.append
+        append_company_number = history.company_numbers.append
+        append_unemployment_duration = history.unemployment_durations.append
+        
+        age = start_age
+        while age < end_age:
             if is_employed:
-                # 就業中の場合
-                separation_rate = self._get_rate_for_age(age, gender, "separation")
-                job_change_rate = self._get_rate_for_age(age, gender, "job_change")
-                
-                # 離職率から転職率を引いた分が「純粋な離職（無職になる）」の確率
-                pure_separation_rate = max(0, separation_rate - job_change_rate)
+                # 就業中の場合：転職または離職が次に起きる年齢まで読み飛ばす
+                age = draw_event_age(age, end_age, event_table, event_fallback, event_segment_ends)
+                if age >= end_age:
+                    break
                 
-                rand = random.random() * 100
+                if 0 <= age < table_size:
+                    event_rate = event_table[age]
+                    job_change_rate = job_change_table[age]
+                else:
+                    event_rate = event_fallback
+                    job_change_rate = job_change_fallback
                 
-                if rand < job_change_rate:
+                # イベントが起きた年に、転職か純粋な離職（無職になる）かを率の比で決める
+                if rand() * event_rate < job_change_rate:
                     # 転職（会社から会社へ直接移動）
                     current_company += 1
                     # 転職時に新しい産業を選択（同じ産業の可能性もある）
-                    new_industry = self.select_industry(gender)
-                    events.append({
-                        "age": age,
-                        "type": "転職",
-                        "industry": new_industry,
-                        "previous_industry": current_industry,
-                        "company_number": current_company,
-                    })
+                    if not industry_pool:
+                        industry_pool = select_industries(INDUSTRY_POOL_SIZE, gender)
+                    new_industry = industry_pool.pop()
+                    append_age(age)
+                    append_type(EVENT_TYPE_CHANGE)
+                    append_industry(new_industry)
+                    append_previous_industry(current_industry)
+                    append_company_number(current_company)
+                    append_unemployment_duration(None)
                     current_industry = new_industry
                     
-                elif rand < job_change_rate + pure_separation_rate:
+                else:
                     # 離職（無職になる）
                     is_employed = False
                     unemployment_start_age = age
-                    events.append({
-                        "age": age,
-                        "type": "離職",
-                        "industry": current_industry,
-                    })
+                    append_age(age)
+                    append_type(EVENT_TYPE_SEPARATION)
+                    append_industry(current_industry)
+                    append_previous_industry(None)
+                    append_company_number(None)
+                    append_unemployment_duration(None)
             else:
-                # 無職の場合：再就職するかどうかを判定
-                reemployment_rate = self._get_rate_for_age(age, gender, "reemployment")
+                # 無職の場合：再就職する年齢まで読み飛ばす
+                age = draw_event_age(
+                    age, end_age, reemployment_table, reemployment_fallback, reemployment_segment_ends
+                )
+                if age >= end_age:
+                    break
                 
-                if random.random() * 100 < reemployment_rate:
-                    # 再就職
-                    current_company += 1
-                    is_employed = True
-                    unemployment_duration = age - unemployment_start_age
-                    new_industry = self.select_industry(gender)
-                    events.append({
-                        "age": age,
-                        "type": "再就職",
-                        "industry": new_industry,
-                        "company_number": current_company,
-                        "unemployment_duration": unemployment_duration,
-                    })
-                    current_industry = new_industry
-                    unemployment_start_age = None
+                # 再就職
+                current_company += 1
+                is_employed = True
+                if not industry_pool:
+                    industry_pool = select_industries(INDUSTRY_POOL_SIZE, gender)
+                new_industry = industry_pool.pop()
+                append_age(age)
+                append_type(EVENT_TYPE_REEMPLOYMENT)
+                append_industry(new_industry)
+                append_previous_industry(None)
+                append_company_number(current_company)
+                append_unemployment_duration(age - unemployment_start_age)
+                current_industry = new_industry
+                unemployment_start_age = None
+            
+            age += 1
         
-        return events
+        return history
     
     def get_career_summary(self, career_history: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -281,38 +612,72 @@ class CareerSimulator:
         Returns:
             サマリー情報
         """
-        job_changes = [e for e in career_history if e["type"] == "転職"]
-        separations = [e for e in career_history if e["type"] == "離職"]
-        reemployments = [e for e in career_history if e["type"] == "再就職"]
-        
-        total_unemployment_years = sum(
-            e.get("unemployment_duration", 0) for e in reemployments
-        )
+        total_job_changes = 0
+        total_separations = 0
+        total_reemployments = 0
+        total_companies = 1
+        total_unemployment_years = 0
+        last_industry = None
+        last_type = None
+        
+        # 1回の走査で件数・会社数・無職期間・最後の状態をまとめて集計
+        for event in career_history:
+            event_type = event["type"]
+            if event_type == "転職":
+                total_job_changes += 1
+            elif event_type == "離職":
+                total_separations += 1
+            elif event_type == "再就職":
+                total_reemployments += 1
+                total_unemployment_years += event.get("unemployment_duration", 0)
+            
+            company_number = event.get("company_number", 1)
+            if company_number > total_companies:
+                total_companies = company_number
+            
+            industry = event.get("industry")
+            if industry:
+                last_industry = industry
+            last_type = event_type
         
         # 最後の状態を確認
-        if career_history:
-            last_event = career_history[-1]
-            is_employed = last_event["type"] != "離職"
-        else:
-            is_employed = True
-        
-        # 最後の産業を取得
-        last_industry = None
-        for event in reversed(career_history):
-            if event.get("industry"):
-                last_industry = event["industry"]
-                break
+        is_employed = last_type != "離職"
         
         return {
-            "total_job_changes": len(job_changes),
-            "total_separations": len(separations),
-            "total_reemployments": len(reemployments),
-            "total_companies": max([e.get("company_number", 1) for e in career_history], default=1),
+            "total_job_changes": total_job_changes,
+            "total_separations": total_separations,
+            "total_reemployments": total_reemployments,
+            "total_companies": total_companies,
             "total_unemployment_years": total_unemployment_years,
             "final_employment_status": "就業中" if is_employed else "無職",
             "final_industry": last_industry,
         }
     
+    def summarize_career_events(self, history: CareerHistory) -> Dict[str, Any]:
+        """
+        並列リスト形式のキャリア履歴からサマリー情報を生成
+        
+        get_career_summary()と同じ結果を、イベントの辞書を作らずに求める
+        
+        Args:
+            history: simulate_career_events()の戻り値
+        
+        Returns:
+            サマリー情報
+        """
+        types = history.types
+        is_employed = types[-1] != EVENT_TYPE_SEPARATION if types else True
+        
+        return {
+            "total_job_changes": types.count(EVENT_TYPE_CHANGE),
+            "total_separations": types.count(EVENT_TYPE_SEPARATION),
+            "total_reemployments": types.count(EVENT_TYPE_REEMPLOYMENT),
+            "total_companies": max(filter(None, history.company_numbers), default=1),
+            "total_unemployment_years": sum(filter(None, history.unemployment_durations)),
+            "final_employment_status": "就業中" if is_employed else "無職",
+            "final_industry": next(filter(None, reversed(history.industries)), None),
+        }
+    
     def select_company_size(self, education_level: str, university_rank: str = None) -> str:
         """
         企業規模を学歴・大学ランクに基づいてランダムに選択
@@ -327,6 +692,19 @@ class CareerSimulator:
         Returns:
             企業規模（"大企業", "中企業", "小企業"）
         """
+        key = (education_level, university_rank)
+        table = self._company_size_tables.get(key)
+        if table is None:
+            table = self._company_size_tables[key] = self._build_cumulative_table(
+                self._company_size_distribution(education_level, university_rank)
+            )
+        
+        # 重み付きランダム選択
+        return self._select_from_table(table)
+    
+    @staticmethod
+    def _company_size_distribution(education_level: str, university_rank: str = None) -> Dict[str, float]:
+        """学歴・大学ランクに応じた企業規模の分布（%）"""
         distribution = COMPANY_SIZE_DISTRIBUTION_BY_EDUCATION.get(
             education_level,
             COMPANY_SIZE_DISTRIBUTION_BY_EDUCATION["default"]
@@ -349,17 +727,7 @@ class CareerSimulator:
                 distribution["中企業"] = distribution.get("中企業", 40) + 5
                 distribution["小企業"] = distribution.get("小企業", 25) + 5
         
-        # 重み付きランダム選択
-        total = sum(distribution.values())
-        rand = random.uniform(0, total)
-        cumulative = 0
-        
-        for size, weight in distribution.items():
-            cumulative += weight
-            if rand <= cumulative:
-                return size
-        
-        return "中企業"  # フォールバック
+        return distribution
     
     def select_employment_type(self, education_level: str, gender: str) -> str:
         """
@@ -374,27 +742,22 @@ class CareerSimulator:
         Returns:
             雇用形態（"正社員", "非正規"）
         """
-        edu_distribution = EMPLOYMENT_TYPE_DISTRIBUTION.get(
-            education_level,
-            EMPLOYMENT_TYPE_DISTRIBUTION["default"]
-        )
-        
-        gender_distribution = edu_distribution.get(
-            gender,
-            edu_distribution.get("男性", {"正社員": 75, "非正規": 25})
-        )
+        key = (education_level, gender)
+        table = self._employment_type_tables.get(key)
+        if table is None:
+            edu_distribution = EMPLOYMENT_TYPE_DISTRIBUTION.get(
+                education_level,
+                EMPLOYMENT_TYPE_DISTRIBUTION["default"]
+            )
+            
+            gender_distribution = edu_distribution.get(
+                gender,
+                edu_distribution.get("男性", {"正社員": 75, "非正規": 25})
+            )
+            table = self._employment_type_tables[key] = self._build_cumulative_table(gender_distribution)
         
         # 重み付きランダム選択
-        total = sum(gender_distribution.values())
-        rand = random.uniform(0, total)
-        cumulative = 0
-        
-        for emp_type, weight in gender_distribution.items():
-            cumulative += weight
-            if rand <= cumulative:
-                return emp_type
-        
-        return "正社員"  # フォールバック
+        return self._select_from_table(table)
     
     def simulate_entrepreneurship(
         self,
@@ -434,7 +797,7 @@ class CareerSimulator:
             base_probability *= 1.2  # Aランク大学卒は起業率1.2倍
         
         # 起業するかどうかを判定
-        if random.random() * 100 >= base_probability:
+        if self._rng.random() * 100 >= base_probability:
             return {
                 "is_entrepreneur": False,
                 "success_tier": None,
@@ -443,7 +806,7 @@ class CareerSimulator:
             }
         
         # 起業した場合、成功度合いを決定
-        rand = random.random()
+        rand = self._rng.random()
         cumulative = 0
         
         for tier in ENTREPRENEUR_SUCCESS_TIERS:
@@ -513,7 +876,7 @@ class CareerSimulator:
             base_probability = EXECUTIVE_PROMOTION_PROBABILITY["default"]
         
         # 役員に昇進するかどうかを判定
-        if random.random() * 100 >= base_probability:
+        if self._rng.random() * 100 >= base_probability:
             return {
                 "is_executive": False,
                 "executive_level": None,
@@ -522,7 +885,7 @@ class CareerSimulator:
             }
         
         # 役員に昇進した場合、レベルを決定
-        rand = random.random()
+        rand = self._rng.random()
         cumulative = 0
         
         for tier in EXECUTIVE_INCOME_TIERS:
@@ -10,11 +10,16 @@
 """
 
 import random
-from typing import Dict, List, Any
+from itertools import accumulate
+from typing import Dict, List, Any, Optional, Tuple
 
 from ..constants.scores import AGE_BASED_DEATH_CAUSES, get_age_group_for_death_cause
 
 
+# 年齢（0〜99歳）→ 死因選択用の年代グループ（範囲外の年齢は関数で判定する）
+_AGE_TO_DEATH_CAUSE_GROUP = tuple(get_age_group_for_death_cause(age) for age in range(100))
+
+
 class DeathSimulator:
     """死亡に関するシミュレーションを担当するクラス"""
     
@@ -22,6 +27,7 @@ class DeathSimulator:
         self,
         death_by_age: List[Dict[str, Any]],
         death_by_cause: List[Dict[str, Any]],
+        rng: Optional[random.Random] = None,
     ):
         """
         初期化
@@ -29,9 +35,62 @@ class DeathSimulator:
         Args:
             death_by_age: 年齢別死亡者数データ
             death_by_cause: 死因別死亡者数データ（フォールバック用）
+            rng: 乱数生成器（Noneの場合はrandomモジュールの関数をそのまま使い、
+                 random.seed() による再現性を保つ）
         """
         self.death_by_age = death_by_age
         self.death_by_cause = death_by_cause
+        self._rng = rng if rng is not None else random
+        
+        # 死亡年齢の累積重み（二分探索で選択する）
+        death_by_age = self.death_by_age or []
+        self._death_ages = tuple(item["age"] for item in death_by_age)
+        self._death_age_cumulative = list(accumulate(item["count"] for item in death_by_age))
+        self._death_age_total = sum(item["count"] for item in death_by_age)
+        
+        # フォールバック用の死因の累積重み（全死因、および80歳未満用に老衰を除いたもの）
+        death_by_cause = self.death_by_cause or []
+        self._cause_table_all = self._build_cause_table(death_by_cause)
+        self._cause_table_no_senility = self._build_cause_table(
+            [item for item in death_by_cause if item["cause"] != "老衰"]
+        )
+        
+        # 年代グループごとの死因の累積重み
+        self._age_group_cause_tables = {
+            age_group: (tuple(distribution.keys()), list(accumulate(distribution.values())))
+            for age_group, distribution in AGE_BASED_DEATH_CAUSES.items()
+            if distribution
+        }
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """pickle時、randomモジュールを使っている場合はNoneに置き換える（モジュールはpickleできない）"""
+        state = self.__dict__.copy()
+        if state["_rng"] is random:
+            state["_rng"] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """unpickle時、乱数生成器がNoneならrandomモジュールに戻す"""
+        self.__dict__.update(state)
+        if self._rng is None:
+            self._rng = random
+    
+    @staticmethod
+    def _build_cause_table(causes: List[Dict[str, Any]]) -> Tuple[tuple, List[int], int]:
+        """
+        死因別死亡者数データから (死因, 累積死亡者数, 合計) を構築
+        
+        Args:
+            causes: 死因別死亡者数データ
+        
+        Returns:
+            (死因のタプル, 累積死亡者数のリスト, 死亡者数の合計)
+        """
+        return (
+            tuple(item["cause"] for item in causes),
+            list(accumulate(item["count"] for item in causes)),
+            sum(item["count"] for item in causes),
+        )
     
     def select_death_age(self) -> int:
         """
@@ -41,20 +100,26 @@ class DeathSimulator:
             死亡年齢
         """
         if not self.death_by_age:
-            return random.randint(70, 85)
+            return self._rng.randint(70, 85)
         
-        total_deaths = sum(item["count"] for item in self.death_by_age)
-        if total_deaths == 0:
-            return random.randint(70, 85)
+        if self._death_age_total == 0:
+            return self._rng.randint(70, 85)
         
-        rand = random.uniform(0, total_deaths)
-        cumulative = 0
-        for item in self.death_by_age:
-            cumulative += item["count"]
-            if rand <= cumulative:
-                return item["age"]
+        return self._rng.choices(self._death_ages, cum_weights=self._death_age_cumulative)[0]
+    
+    def select_death_ages(self, n: int) -> List[int]:
+        """
+        死亡年齢をn人分まとめて選択（複数人の一括生成用）
+        
+        Args:
+            n: 人数
         
-        return self.death_by_age[-1]["age"]
+        Returns:
+            死亡年齢のリスト
+        """
+        if self._death_age_total == 0:
+            return [self.select_death_age() for _ in range(n)]
+        return self._rng.choices(self._death_ages, cum_weights=self._death_age_cumulative, k=n)
     
     def select_death_cause(self, death_age: int = None) -> str:
         """
@@ -78,21 +143,22 @@ class DeathSimulator:
         if death_age is None:
             age_group = "70-79"  # デフォルトは高齢期
         else:
-            age_group = get_age_group_for_death_cause(death_age)
+            age_group = (
+                _AGE_TO_DEATH_CAUSE_GROUP[death_age]
+                if 0 <= death_age < len(_AGE_TO_DEATH_CAUSE_GROUP)
+                else get_age_group_for_death_cause(death_age)
+            )
         
-        # 年代別死因分布を取得
-        causes_distribution = AGE_BASED_DEATH_CAUSES.get(age_group)
+        # 年代別死因分布の累積重みを取得
+        cause_table = self._age_group_cause_tables.get(age_group)
         
-        if not causes_distribution:
+        if cause_table is None:
             # フォールバック: 旧方式（death_by_causeデータ）を使用
             return self._select_death_cause_fallback(death_age)
         
         # 重み付きランダム選択
-        causes = list(causes_distribution.keys())
-        weights = list(causes_distribution.values())
-        
-        selected_cause = random.choices(causes, weights=weights, k=1)[0]
-        return selected_cause
+        causes, cumulative = cause_table
+        return self._rng.choices(causes, cum_weights=cumulative)[0]
     
     def _select_death_cause_fallback(self, death_age: int = None) -> str:
         """
@@ -108,22 +174,15 @@ class DeathSimulator:
             return "不明"
         
         # 80歳未満の場合は老衰を除外
-        available_causes = self.death_by_cause
         if death_age is not None and death_age < 80:
-            available_causes = [item for item in self.death_by_cause if item["cause"] != "老衰"]
+            causes, cumulative, total_deaths = self._cause_table_no_senility
+        else:
+            causes, cumulative, total_deaths = self._cause_table_all
         
-        if not available_causes:
+        if not causes:
             return "不明"
         
-        total_deaths = sum(item["count"] for item in available_causes)
         if total_deaths == 0:
-            return random.choice(available_causes)["cause"] if available_causes else "不明"
-        
-        rand = random.uniform(0, total_deaths)
-        cumulative = 0
-        for item in available_causes:
-            cumulative += item["count"]
-            if rand <= cumulative:
-                return item["cause"]
+            return self._rng.choice(causes)
         
-        return available_causes[-1]["cause"]
+        return self._rng.choices(causes, cum_weights=cumulative)[0]
@@ -5,7 +5,16 @@
 """
 
 import random
-from typing import Dict, List, Any, Optional
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from ..constants import UNIVERSITY_RANKS
+from ._sampling import AliasTable, build_alias_table, sample_alias
+
+
+# 市町村名から「市」「町」「村」を取り除く変換表（str.translate用）
+_CITY_SUFFIX_TABLE = str.maketrans("", "", "市町村")
 
 
 class EducationSimulator:
@@ -53,6 +62,7 @@ class EducationSimulator:
         universities_by_prefecture: Dict[str, List[Dict[str, Any]]],
         parent_education_effect: Optional[Dict[str, Dict[str, float]]] = None,
         parent_income_effect: Optional[Dict[str, Dict[str, float]]] = None,
+        rng: Optional[random.Random] = None,
     ):
         """
         初期化
@@ -65,6 +75,8 @@ class EducationSimulator:
             universities_by_prefecture: 都道府県別大学リスト
             parent_education_effect: 親学歴が子学歴に与える影響の係数
             parent_income_effect: 親の世帯年収が子学歴に与える影響の係数
+            rng: 乱数生成器（Noneの場合はrandomモジュールの関数をそのまま使い、
+                 random.seed() による再現性を保つ）
         """
         self.high_school_rates = high_school_rates
         self.high_schools_by_city = high_schools_by_city
@@ -73,6 +85,76 @@ class EducationSimulator:
         self.universities_by_prefecture = universities_by_prefecture
         self.parent_education_effect = parent_education_effect or {}
         self.parent_income_effect = parent_income_effect or {}
+        self._rng = rng if rng is not None else random
+        
+        # 市町村別の進学率（%）を確率（0〜1）に変換しておく
+        self._high_school_probabilities = {city: rate / 100 for city, rate in self.high_school_rates.items()}
+        self._high_school_default_probability = self.high_school_rates.get("default", 98.0) / 100
+        self._university_probabilities = {city: rate / 100 for city, rate in self.university_rates.items()}
+        self._university_default_probability = self.university_rates.get("default", 50.0) / 100
+        
+        # (父学歴, 母学歴, 世帯年収) → (高校進学の家庭環境補正, 大学進学の家庭環境補正)
+        self._family_modifier_cache: Dict[tuple, Tuple[float, float]] = {}
+        
+        # 高校リストのキーと、そこから「市」「町」「村」を除いた名前の組（部分一致の検索用）
+        self._high_school_base_keys = [
+            (key, key.translate(_CITY_SUFFIX_TABLE)) for key in self.high_schools_by_city
+        ]
+        
+        # 市町村 → 候補となる高校のリスト（select_high_school_name()で初回に構築）
+        self._high_school_candidates_cache: Dict[str, List[Any]] = {}
+        
+        # 大学進学先・大学名（入学者数のみで選ぶ場合）のエイリアステーブルを事前構築
+        self._destination_alias = build_alias_table(
+            [item["prefecture"] for item in self.university_destinations or []],
+            [item["count"] for item in self.university_destinations or []],
+        )
+        # 都道府県ごとの大学データは項目ごとの並列タプルにしておく
+        # （結果の (大学名, 大学ランク), 偏差値, 入学者数）
+        self._university_columns: Dict[str, Tuple[tuple, tuple, tuple]] = {
+            prefecture: (
+                tuple((univ["name"], UNIVERSITY_RANKS.get(univ["name"], "D")) for univ in universities),
+                tuple(univ.get("deviation_value", 50) for univ in universities),
+                tuple(univ["enrollment"] for univ in universities),
+            )
+            for prefecture, universities in (self.universities_by_prefecture or {}).items()
+        }
+        self._university_alias_by_prefecture = {
+            prefecture: build_alias_table(results, enrollments)
+            for prefecture, (results, _, enrollments) in self._university_columns.items()
+        }
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """pickle時、randomモジュールを使っている場合はNoneに置き換える（モジュールはpickleできない）"""
+        state = self.__dict__.copy()
+        if state["_rng"] is random:
+            state["_rng"] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """unpickle時、乱数生成器がNoneならrandomモジュールに戻す"""
+        self.__dict__.update(state)
+        if self._rng is None:
+            self._rng = random
+    
+    def _sample_alias(self, table: AliasTable) -> Any:
+        """エイリアステーブルから1件をO(1)で選択"""
+        return sample_alias(table, self._rng.random)
+    
+    def _select_weighted(self, items: List[Any], weights: Iterable[float]) -> Any:
+        """
+        重み付きランダム選択（累積重みを二分探索）
+        
+        Args:
+            items: 選択肢のリスト
+            weights: 各選択肢の重み（合計は正であること）
+        
+        Returns:
+            選択された要素
+        """
+        cumulative = list(accumulate(weights))
+        index = bisect_left(cumulative, self._rng.random() * cumulative[-1])
+        return items[min(index, len(items) - 1)]
     
     def _get_parent_education_modifier(
         self,
@@ -132,6 +214,37 @@ class EducationSimulator:
         
         return 1.0
     
+    def _get_family_modifiers(
+        self,
+        father_education: Optional[str],
+        mother_education: Optional[str],
+        household_income: Optional[str],
+    ) -> Tuple[float, float]:
+        """
+        親学歴・世帯年収から家庭環境補正を計算（組み合わせごとにキャッシュ）
+        
+        家庭環境補正 = (親学歴補正 + 世帯年収補正) / 2
+        
+        Args:
+            father_education: 父親の最終学歴
+            mother_education: 母親の最終学歴
+            household_income: 世帯年収
+        
+        Returns:
+            (高校進学の補正係数, 大学進学の補正係数)
+        """
+        key = (father_education, mother_education, household_income)
+        modifiers = self._family_modifier_cache.get(key)
+        if modifiers is None:
+            modifiers = self._family_modifier_cache[key] = tuple(
+                (
+                    self._get_parent_education_modifier(father_education, mother_education, modifier_type)
+                    + self._get_income_modifier(household_income, modifier_type)
+                ) / 2
+                for modifier_type in ("high_school_modifier", "university_modifier")
+            )
+        return modifiers
+    
     def _get_deviation_value_modifier(self, deviation_value: Optional[float]) -> float:
         """
         高校偏差値から大学進学率の補正係数を計算
@@ -178,24 +291,56 @@ class EducationSimulator:
         Returns:
             高校に進学するかどうか
         """
-        base_rate = self.high_school_rates.get(city, self.high_school_rates.get("default", 98.0))
+        base_probability = self._high_school_probabilities.get(city, self._high_school_default_probability)
         
-        # 親学歴による補正
-        education_modifier = self._get_parent_education_modifier(
-            father_education, mother_education, "high_school_modifier"
+        # 親学歴と世帯年収の補正を組み合わせる（相関があるため平均を取る）
+        combined_modifier, _ = self._get_family_modifiers(
+            father_education, mother_education, household_income
         )
         
-        # 世帯年収による補正
-        income_modifier = self._get_income_modifier(
-            household_income, "high_school_modifier"
-        )
+        # 補正後の進学確率（100%を超えないように）
+        adjusted_probability = min(1.0, base_probability * combined_modifier)
         
-        # 補正後の進学率（100%を超えないように）
-        # 親学歴と世帯年収の補正を組み合わせる（相関があるため平均を取る）
-        combined_modifier = (education_modifier + income_modifier) / 2
-        adjusted_rate = min(100.0, base_rate * combined_modifier)
+        return self._rng.random() < adjusted_probability
+    
+    def decide_high_schools(
+        self,
+        cities: List[str],
+        father_educations: Optional[List[Optional[str]]] = None,
+        mother_educations: Optional[List[Optional[str]]] = None,
+        household_incomes: Optional[List[Optional[str]]] = None,
+    ) -> List[bool]:
+        """
+        高校進学をn人分まとめて決定（複数人の一括生成用）
         
-        return random.random() * 100 < adjusted_rate
+        各人についてdecide_high_school()と同じ判定を行う
+        
+        Args:
+            cities: 出身市町村のリスト
+            father_educations: 父親の最終学歴のリスト
+            mother_educations: 母親の最終学歴のリスト
+            household_incomes: 世帯年収のリスト
+        
+        Returns:
+            高校に進学するかどうかのリスト
+        """
+        n = len(cities)
+        probabilities = self._high_school_probabilities
+        default_probability = self._high_school_default_probability
+        get_family_modifiers = self._get_family_modifiers
+        rand = self._rng.random
+        
+        results = []
+        for city, father_education, mother_education, household_income in zip(
+            cities,
+            father_educations or [None] * n,
+            mother_educations or [None] * n,
+            household_incomes or [None] * n,
+        ):
+            combined_modifier, _ = get_family_modifiers(father_education, mother_education, household_income)
+            adjusted_probability = min(1.0, probabilities.get(city, default_probability) * combined_modifier)
+            results.append(rand() < adjusted_probability)
+        return results
     
     # 東京都の市区町村リスト（地理的制約を排除する判定に使用）
     TOKYO_CITIES = {
@@ -212,19 +357,15 @@ class EducationSimulator:
         """東京都の市区町村かどうかを判定"""
         return city in self.TOKYO_CITIES
     
-    def select_high_school_name(self, city: str, deviation_value: float = None) -> tuple:
+    def _collect_high_school_candidates(self, city: str) -> List[Any]:
         """
-        出生地に近接した高校名を偏差値・入学者数に基づいて選択
-        
-        東京都の場合は地理的制約を排除し、全高校から選択可能。
-        入学者数に基づいた重み付け選択を実装。
+        出身市町村から候補となる高校のリストを集める
         
         Args:
             city: 出身市町村
-            deviation_value: 個人の偏差値（指定がなければランダム選択）
             
         Returns:
-            (高校名, 高校偏差値) のタプル
+            候補となる高校のリスト（見つからない場合は空リスト）
         """
         # 候補となる高校を集める
         candidate_schools = []
@@ -249,19 +390,40 @@ class EducationSimulator:
             
             # 市町村名の部分一致で探す
             if not candidate_schools:
-                city_base = city.replace("市", "").replace("町", "").replace("村", "")
-                for key, schools in self.high_schools_by_city.items():
-                    if city_base in key or key.replace("市", "").replace("町", "").replace("村", "") in city:
-                        candidate_schools.extend(schools)
+                city_base = city.translate(_CITY_SUFFIX_TABLE)
+                for key, key_base in self._high_school_base_keys:
+                    if city_base in key or key_base in city:
+                        candidate_schools.extend(self.high_schools_by_city[key])
             
             # 候補がない場合は全体から選択
             if not candidate_schools:
                 for schools in self.high_schools_by_city.values():
                     candidate_schools.extend(schools)
         
+        return candidate_schools
+    
+    def select_high_school_name(self, city: str, deviation_value: float = None) -> tuple:
+        """
+        出生地に近接した高校名を偏差値・入学者数に基づいて選択
+        
+        東京都の場合は地理的制約を排除し、全高校から選択可能。
+        入学者数に基づいた重み付け選択を実装。
+        
+        Args:
+            city: 出身市町村
+            deviation_value: 個人の偏差値（指定がなければランダム選択）
+            
+        Returns:
+            (高校名, 高校偏差値) のタプル
+        """
+        # 候補となる高校（市町村ごとに初回だけ集めてキャッシュ）
+        candidate_schools = self._high_school_candidates_cache.get(city)
+        if candidate_schools is None:
+            candidate_schools = self._high_school_candidates_cache[city] = self._collect_high_school_candidates(city)
+        
         if not candidate_schools:
             # 見つからない場合は汎用名を生成
-            city_short = city.replace("市", "").replace("町", "").replace("村", "")
+            city_short = city.translate(_CITY_SUFFIX_TABLE)
             return (f"{city_short}高校", 50.0)
         
         # 偏差値が指定されている場合、マッチする高校を優先選択
@@ -288,14 +450,7 @@ class EducationSimulator:
                         weight = enrollment * proximity_bonus
                         weights.append(weight)
                     
-                    total_weight = sum(weights)
-                    rand = random.uniform(0, total_weight)
-                    cumulative = 0
-                    for i, s in enumerate(matching_schools):
-                        cumulative += weights[i]
-                        if rand <= cumulative:
-                            return (s["name"], s.get("deviation_value", 50.0))
-                    selected = matching_schools[-1]
+                    selected = self._select_weighted(matching_schools, weights)
                     return (selected["name"], selected.get("deviation_value", 50.0))
                 else:
                     # マッチする高校がなければ最も近い偏差値の高校から入学者数で重み付け選択
@@ -305,34 +460,22 @@ class EducationSimulator:
                     )
                     # 上位10校から入学者数で重み付け選択
                     top_schools = sorted_schools[:10]
-                    weights = [s.get("enrollment", 280) for s in top_schools]
-                    total_weight = sum(weights)
-                    rand = random.uniform(0, total_weight)
-                    cumulative = 0
-                    for i, s in enumerate(top_schools):
-                        cumulative += weights[i]
-                        if rand <= cumulative:
-                            return (s["name"], s.get("deviation_value", 50.0))
-                    selected = top_schools[-1]
+                    selected = self._select_weighted(
+                        top_schools, [s.get("enrollment", 280) for s in top_schools]
+                    )
                     return (selected["name"], selected.get("deviation_value", 50.0))
             else:
                 # 旧形式（文字列リスト）の場合
-                return (random.choice(candidate_schools), 50.0)
+                return (self._rng.choice(candidate_schools), 50.0)
         else:
             # 偏差値指定なしの場合は入学者数に基づいた重み付け選択
             if isinstance(candidate_schools[0], dict):
-                weights = [s.get("enrollment", 280) for s in candidate_schools]
-                total_weight = sum(weights)
-                rand = random.uniform(0, total_weight)
-                cumulative = 0
-                for i, s in enumerate(candidate_schools):
-                    cumulative += weights[i]
-                    if rand <= cumulative:
-                        return (s["name"], s.get("deviation_value", 50.0))
-                selected = candidate_schools[-1]
+                selected = self._select_weighted(
+                    candidate_schools, [s.get("enrollment", 280) for s in candidate_schools]
+                )
                 return (selected["name"], selected.get("deviation_value", 50.0))
             else:
-                return (random.choice(candidate_schools), 50.0)
+                return (self._rng.choice(candidate_schools), 50.0)
     
     def decide_university(
         self,
@@ -372,28 +515,122 @@ class EducationSimulator:
         if not went_to_high_school:
             return False
         
-        base_rate = self.university_rates.get(city, self.university_rates.get("default", 50.0))
-        
-        # 親学歴による補正
-        education_modifier = self._get_parent_education_modifier(
-            father_education, mother_education, "university_modifier"
-        )
+        base_probability = self._university_probabilities.get(city, self._university_default_probability)
         
-        # 世帯年収による補正
-        income_modifier = self._get_income_modifier(
-            household_income, "university_modifier"
+        # 親学歴と世帯年収の補正を組み合わせる（相関があるため平均を取る）
+        _, family_modifier = self._get_family_modifiers(
+            father_education, mother_education, household_income
         )
         
         # 偏差値による補正
         deviation_modifier = self._get_deviation_value_modifier(high_school_deviation_value)
         
-        # 補正後の進学率（100%を超えないように、0%を下回らないように）
-        # 親学歴と世帯年収の補正を組み合わせる（相関があるため平均を取る）
+        # 補正後の進学確率（100%を超えないように、0%を下回らないように）
         # 偏差値補正は独立した要因として乗算
-        family_modifier = (education_modifier + income_modifier) / 2
-        adjusted_rate = min(100.0, max(0.0, base_rate * family_modifier * deviation_modifier))
+        adjusted_probability = min(1.0, max(0.0, base_probability * family_modifier * deviation_modifier))
+        
+        return self._rng.random() < adjusted_probability
+    
+    def decide_universities(
+        self,
+        cities: List[str],
+        went_to_high_schools: List[bool],
+        father_educations: Optional[List[Optional[str]]] = None,
+        mother_educations: Optional[List[Optional[str]]] = None,
+        household_incomes: Optional[List[Optional[str]]] = None,
+        high_school_deviation_values: Optional[List[Optional[float]]] = None,
+    ) -> List[bool]:
+        """
+        大学進学をn人分まとめて決定（複数人の一括生成用）
+        
+        各人についてdecide_university()と同じ判定を行う
+        
+        Args:
+            cities: 出身市町村のリスト
+            went_to_high_schools: 高校に進学したかどうかのリスト
+            father_educations: 父親の最終学歴のリスト
+            mother_educations: 母親の最終学歴のリスト
+            household_incomes: 世帯年収のリスト
+            high_school_deviation_values: 高校偏差値のリスト
+        
+        Returns:
+            大学に進学するかどうかのリスト
+        """
+        n = len(cities)
+        probabilities = self._university_probabilities
+        default_probability = self._university_default_probability
+        get_family_modifiers = self._get_family_modifiers
+        get_deviation_modifier = self._get_deviation_value_modifier
+        rand = self._rng.random
+        
+        results = []
+        for city, went_to_high_school, father_education, mother_education, household_income, deviation_value in zip(
+            cities,
+            went_to_high_schools,
+            father_educations or [None] * n,
+            mother_educations or [None] * n,
+            household_incomes or [None] * n,
+            high_school_deviation_values or [None] * n,
+        ):
+            if not went_to_high_school:
+                results.append(False)
+                continue
+            
+            _, family_modifier = get_family_modifiers(father_education, mother_education, household_income)
+            base_probability = probabilities.get(city, default_probability)
+            adjusted_probability = min(
+                1.0, max(0.0, base_probability * family_modifier * get_deviation_modifier(deviation_value))
+            )
+            results.append(rand() < adjusted_probability)
+        return results
+    
+    def decide_higher_education(
+        self,
+        city: str,
+        went_to_high_school: bool,
+        father_education: Optional[str] = None,
+        mother_education: Optional[str] = None,
+        household_income: Optional[str] = None,
+        high_school_deviation_value: Optional[float] = None
+    ) -> Tuple[bool, bool]:
+        """
+        大学進学と専門学校・短大進学を1回の乱数でまとめて決定
+        
+        decide_university()で大学に進学しなかった場合にdecide_vocational_school()を
+        判定するのと同じ確率になる（大学に進学しなかった分の乱数の残りを再利用する）
+        
+        Args:
+            city: 出身市町村
+            went_to_high_school: 高校に進学したかどうか
+            father_education: 父親の最終学歴
+            mother_education: 母親の最終学歴
+            household_income: 世帯年収
+            high_school_deviation_value: 高校偏差値（または個人の学力偏差値）
+        
+        Returns:
+            (大学に進学するかどうか, 専門学校・短大に進学するかどうか)
+        """
+        if not went_to_high_school:
+            return (False, False)
+        
+        _, family_modifier = self._get_family_modifiers(
+            father_education, mother_education, household_income
+        )
         
-        return random.random() * 100 < adjusted_rate
+        # 大学進学確率（decide_university()と同じ計算）
+        base_probability = self._university_probabilities.get(city, self._university_default_probability)
+        deviation_modifier = self._get_deviation_value_modifier(high_school_deviation_value)
+        university_probability = min(1.0, max(0.0, base_probability * family_modifier * deviation_modifier))
+        
+        r = self._rng.random()
+        if r < university_probability:
+            return (True, False)
+        
+        # 大学に進学しなかった場合、乱数の残り（0〜1に正規化）で専門学校・短大進学を判定
+        # （decide_vocational_school()と同じ計算）
+        vocational_probability = max(0.0, min(1.0, 0.30 * family_modifier))
+        r = (r - university_probability) / (1.0 - university_probability)
+        return (False, r < vocational_probability)
     
     def select_university_destination(self) -> str:
         """
@@ -405,18 +642,11 @@ class EducationSimulator:
         if not self.university_destinations:
             return "北海道"
         
-        total_students = sum(item["count"] for item in self.university_destinations)
-        if total_students == 0:
-            return random.choice(self.university_destinations)["prefecture"] if self.university_destinations else "北海道"
-        
-        rand = random.uniform(0, total_students)
-        cumulative = 0
-        for item in self.university_destinations:
-            cumulative += item["count"]
-            if rand <= cumulative:
-                return item["prefecture"]
+        if self._destination_alias is None:
+            # 進学者数の合計が0の場合は均等に選択
+            return self._rng.choice(self.university_destinations)["prefecture"]
         
-        return self.university_destinations[-1]["prefecture"]
+        return self._sample_alias(self._destination_alias)
     
     def select_university_name(self, prefecture: str, deviation_value: float = None) -> tuple:
         """
@@ -441,8 +671,6 @@ class EducationSimulator:
         Returns:
             (大学名, 大学ランク) のタプル
         """
-        from ..constants import UNIVERSITY_RANKS
-        
         if prefecture in self.universities_by_prefecture:
             universities = self.universities_by_prefecture[prefecture]
         else:
@@ -458,10 +686,10 @@ class EducationSimulator:
             max_dev = deviation_value + 10  # 上は少し狭く（浪人しない限り上位校は難しい）
             
             # 候補大学とその重みを計算
-            weighted_candidates = []
-            for univ in universities:
-                univ_dev = univ.get("deviation_value", 50)
-                
+            results, deviation_values, enrollments = self._university_columns[prefecture]
+            candidates = []
+            weights = []
+            for result, univ_dev, enrollment in zip(results, deviation_values, enrollments):
                 # 偏差値の差を計算
                 diff = abs(univ_dev - deviation_value)
                 
@@ -482,39 +710,22 @@ class EducationSimulator:
                     proximity_bonus *= max(0.1, 1.0 - overshoot * 0.1)
                 
                 # 重み = 入学者数 × 偏差値近接ボーナス
-                weight = univ["enrollment"] * proximity_bonus
+                weight = enrollment * proximity_bonus
                 
                 if weight > 0:
-                    weighted_candidates.append((univ, weight))
+                    candidates.append(result)
+                    weights.append(weight)
             
             # 重み付き選択
-            if weighted_candidates:
-                total_weight = sum(w for _, w in weighted_candidates)
-                if total_weight > 0:
-                    rand = random.uniform(0, total_weight)
-                    cumulative = 0
-                    for univ, weight in weighted_candidates:
-                        cumulative += weight
-                        if rand <= cumulative:
-                            return (univ["name"], UNIVERSITY_RANKS.get(univ["name"], "D"))
-                    selected = weighted_candidates[-1][0]
-                    return (selected["name"], UNIVERSITY_RANKS.get(selected["name"], "D"))
+            if candidates:
+                return self._select_weighted(candidates, weights)
         
         # 偏差値指定なし or マッチなしの場合は入学者数に基づく選択
-        total_enrollment = sum(u["enrollment"] for u in universities)
-        if total_enrollment == 0:
-            selected = random.choice(universities)
-            return (selected["name"], UNIVERSITY_RANKS.get(selected["name"], "D"))
-        
-        rand = random.uniform(0, total_enrollment)
-        cumulative = 0
-        for univ in universities:
-            cumulative += univ["enrollment"]
-            if rand <= cumulative:
-                return (univ["name"], UNIVERSITY_RANKS.get(univ["name"], "D"))
-        
-        selected = universities[-1]
-        return (selected["name"], UNIVERSITY_RANKS.get(selected["name"], "D"))
+        table = self._university_alias_by_prefecture.get(prefecture)
+        if table is None:
+            # 入学者数の合計が0の場合は均等に選択
+            return self._rng.choice(self._university_columns[prefecture][0])
+        return self._sample_alias(table)
     
     def _get_expected_university_rank(self, deviation_value: float) -> str:
         """
@@ -529,10 +740,10 @@ class EducationSimulator:
         # 確率的に決定（偏差値に応じてランクが上下する可能性）
         if deviation_value >= 70:
             # 偏差値70+: Sランク70%, Aランク30%
-            return "S" if random.random() < 0.7 else "A"
+            return "S" if self._rng.random() < 0.7 else "A"
         elif deviation_value >= 60:
             # 偏差値60-69: Sランク10%, Aランク60%, Bランク30%
-            rand = random.random()
+            rand = self._rng.random()
             if rand < 0.10:
                 return "S"
             elif rand < 0.70:
@@ -541,7 +752,7 @@ class EducationSimulator:
                 return "B"
         elif deviation_value >= 52:
             # 偏差値52-59: Aランク10%, Bランク60%, Cランク30%
-            rand = random.random()
+            rand = self._rng.random()
             if rand < 0.10:
                 return "A"
             elif rand < 0.70:
@@ -550,7 +761,7 @@ class EducationSimulator:
                 return "C"
         elif deviation_value >= 45:
             # 偏差値45-51: Bランク10%, Cランク60%, Dランク30%
-            rand = random.random()
+            rand = self._rng.random()
             if rand < 0.10:
                 return "B"
             elif rand < 0.70:
@@ -559,7 +770,7 @@ class EducationSimulator:
                 return "D"
         else:
             # 偏差値45未満: Cランク10%, Dランク90%
-            return "C" if random.random() < 0.1 else "D"
+            return "C" if self._rng.random() < 0.1 else "D"
     
     # 大学ランク別の大学院進学率（%）
     # 出典: 文部科学省「学校基本調査」、各大学の進学実績データ
@@ -623,21 +834,13 @@ class EducationSimulator:
         gender_modifier = self.GRADUATE_SCHOOL_GENDER_MODIFIER.get(gender, 1.0)
         adjusted_rate = base_rate * gender_modifier
 
-        # 親学歴による補正（大学進学と同様）
-        education_modifier = self._get_parent_education_modifier(
-            father_education, mother_education, "university_modifier"
-        )
-
-        # 世帯年収による補正
-        income_modifier = self._get_income_modifier(
-            household_income, "university_modifier"
+        # 親学歴・世帯年収による補正を適用（大学進学と同様。相関があるため平均を取る）
+        _, combined_modifier = self._get_family_modifiers(
+            father_education, mother_education, household_income
         )
-
-        # 補正を適用（相関があるため平均を取る）
-        combined_modifier = (education_modifier + income_modifier) / 2
         final_rate = min(100.0, adjusted_rate * combined_modifier)
 
-        return random.random() * 100 < final_rate
+        return self._rng.random() * 100 < final_rate
 
     def decide_vocational_school(
         self,
@@ -675,22 +878,16 @@ class EducationSimulator:
         if not went_to_high_school:
             return False
         
-        # 基本進学率: 大学不進学者の約30%が専門・短大に進学
-        base_rate = 30.0
-        
-        # 親学歴による補正（大学進学と同様の補正を使用）
-        education_modifier = self._get_parent_education_modifier(
-            father_education, mother_education, "university_modifier"
-        )
+        # 基本進学確率: 大学不進学者の約30%が専門・短大に進学
+        base_probability = 0.30
         
-        # 世帯年収による補正
-        income_modifier = self._get_income_modifier(
-            household_income, "university_modifier"
+        # 親学歴・世帯年収による補正（大学進学と同様の補正を使用）
+        _, combined_modifier = self._get_family_modifiers(
+            father_education, mother_education, household_income
         )
         
-        # 補正後の進学率（100%を超えないように、0%を下回らないように）
-        combined_modifier = (education_modifier + income_modifier) / 2
-        adjusted_rate = max(0.0, min(100.0, base_rate * combined_modifier))
+        # 補正後の進学確率（100%を超えないように、0%を下回らないように）
+        adjusted_probability = max(0.0, min(1.0, base_probability * combined_modifier))
         
-        return random.random() * 100 < adjusted_rate
+        return self._rng.random() < adjusted_probability
 
@@ -5,14 +5,107 @@ SNS反応生成モジュール
 """
 
 import random
-from typing import Dict, List, Any
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Any, Optional
 
 from .constants import SNS_REACTIONS
 
 
+# 反応カテゴリ → 反応の集合（候補の和集合をとるため、import時に1回だけ変換する）
+_SNS_REACTION_SETS = {category: frozenset(reactions) for category, reactions in SNS_REACTIONS.items()}
+
+# スコアベースの反応（ランク基準）: スコアの閾値と、閾値で区切った帯ごとのカテゴリ
+# ★ (15点未満): 極めて厳しい
+# ★★ (15-25点): 多くの困難
+# ★★★ (25-35点): やや困難
+# ★★★★ (35-45点): 平均的
+# ★★★★★ (45-60点): 平均以上
+# ★★★★★★ (60点以上): 非常に恵まれた人生
+_SCORE_REACTION_THRESHOLDS = (15, 25, 35, 45, 60)
+_SCORE_REACTION_CATEGORIES = (
+    "rank_1star", "rank_2star", "rank_3star", "rank_4star", "rank_5star", "rank_6star",
+)
+
+# 死因 → 反応カテゴリの判定ルール（上から順に部分一致で判定）
+_DEATH_CAUSE_RULES = (
+    (("悪性新生物", "腫瘍", "ガン"), "death_cancer"),
+    (("老衰",), "death_old_age"),
+    (("不慮", "事故"), "death_accident"),
+    (("自殺", "自死"), "death_suicide"),
+)
+
+# 死因 → 反応カテゴリの判定結果（死因ごとに1回だけ判定する）
+_DEATH_CAUSE_CATEGORY_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _death_cause_category(death_cause: str) -> Optional[str]:
+    """
+    死因に対応するSNS反応カテゴリを取得する
+    
+    Args:
+        death_cause: 死因
+    
+    Returns:
+        str: SNS_REACTIONSのカテゴリ名（該当なしの場合はNone）
+    """
+    if death_cause in _DEATH_CAUSE_CATEGORY_CACHE:
+        return _DEATH_CAUSE_CATEGORY_CACHE[death_cause]
+    category = None
+    for keywords, rule_category in _DEATH_CAUSE_RULES:
+        if any(keyword in death_cause for keyword in keywords):
+            category = rule_category
+            break
+    _DEATH_CAUSE_CATEGORY_CACHE[death_cause] = category
+    return category
+
+
+# 産業 → 反応カテゴリの判定ルール（上から順に部分一致で判定）
+_INDUSTRY_RULES = (
+    # 高収入産業
+    (("情報通信業", "金融業", "保険業", "電気", "ガス"), "good_industry"),
+    # 低収入産業
+    (("宿泊業", "飲食", "農業", "林業", "漁業"), "bad_industry"),
+)
+
+# 産業 → 反応カテゴリの判定結果（産業ごとに1回だけ判定する）
+_INDUSTRY_CATEGORY_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _industry_category(industry: str) -> Optional[str]:
+    """
+    産業に対応するSNS反応カテゴリを取得する
+    
+    Args:
+        industry: 産業名
+    
+    Returns:
+        str: SNS_REACTIONSのカテゴリ名（該当なしの場合はNone）
+    """
+    if industry in _INDUSTRY_CATEGORY_CACHE:
+        return _INDUSTRY_CATEGORY_CACHE[industry]
+    category = None
+    for keywords, rule_category in _INDUSTRY_RULES:
+        if any(keyword in industry for keyword in keywords):
+            category = rule_category
+            break
+    _INDUSTRY_CATEGORY_CACHE[industry] = category
+    return category
+
+
 class SNSReactionGenerator:
     """SNS反応を生成するクラス"""
     
+    @staticmethod
+    def register_death_causes(death_causes: Iterable[str]) -> None:
+        """
+        死因ごとの反応カテゴリを事前に判定しておく
+        
+        Args:
+            death_causes: 死因の一覧（death_by_causeの死因など）
+        """
+        for death_cause in death_causes:
+            _death_cause_category(death_cause)
+    
     def generate_reactions(
         self,
         life: Dict[str, Any],
@@ -30,108 +123,79 @@ class SNSReactionGenerator:
         Returns:
             list: SNS反応のリスト
         """
-        total_score = score_result["total_score"]
-        breakdown = score_result["breakdown"]
+        # しきい値は表示と同じ小数第1位で丸めた値で判定する
+        total_score = round(score_result["total_score"], 1)
         
         # 候補となる反応カテゴリを決定
-        candidates = []
+        candidates = set()
         
-        # スコアベースの反応（ランク基準）
-        # ★★★★★★ (60点以上): 非常に恵まれた人生
-        # ★★★★★ (45-60点): 平均以上
-        # ★★★★ (35-45点): 平均的
-        # ★★★ (25-35点): やや困難
-        # ★★ (15-25点): 多くの困難
-        # ★ (15点未満): 極めて厳しい
-        if total_score >= 60:
-            candidates.extend(SNS_REACTIONS["rank_6star"])  # ★★★★★★
-        elif total_score >= 45:
-            candidates.extend(SNS_REACTIONS["rank_5star"])  # ★★★★★
-        elif total_score >= 35:
-            candidates.extend(SNS_REACTIONS["rank_4star"])  # ★★★★
-        elif total_score >= 25:
-            candidates.extend(SNS_REACTIONS["rank_3star"])  # ★★★
-        elif total_score >= 15:
-            candidates.extend(SNS_REACTIONS["rank_2star"])  # ★★
-        else:
-            candidates.extend(SNS_REACTIONS["rank_1star"])  # ★
+        # スコアベースの反応（ランク基準。閾値は_SCORE_REACTION_THRESHOLDSを参照）
+        score_category = _SCORE_REACTION_CATEGORIES[
+            bisect_right(_SCORE_REACTION_THRESHOLDS, total_score)
+        ]
+        candidates |= _SNS_REACTION_SETS[score_category]
         
         # 性別ベースの反応
         if life["gender"] == "女性":
-            candidates.extend(SNS_REACTIONS["gender_female"])
+            candidates |= _SNS_REACTION_SETS["gender_female"]
         else:
-            candidates.extend(SNS_REACTIONS["gender_male"])
+            candidates |= _SNS_REACTION_SETS["gender_male"]
         
         # 学歴ベースの反応
         if life["university"]:
-            candidates.extend(SNS_REACTIONS["university"])
+            candidates |= _SNS_REACTION_SETS["university"]
         else:
-            candidates.extend(SNS_REACTIONS["no_university"])
-        
-        # 産業ベースの反応（lifeデータから判定）
-        industry = life.get("industry", "")
-        # 高収入産業
-        high_income_industries = ["情報通信業", "金融業", "保険業", "電気", "ガス"]
-        # 低収入産業
-        low_income_industries = ["宿泊業", "飲食", "農業", "林業", "漁業"]
+            candidates |= _SNS_REACTION_SETS["no_university"]
         
-        if any(ind in industry for ind in high_income_industries):
-            candidates.extend(SNS_REACTIONS["good_industry"])
-        elif any(ind in industry for ind in low_income_industries):
-            candidates.extend(SNS_REACTIONS["bad_industry"])
+        # 産業ベースの反応（lifeデータから判定。高収入産業・低収入産業）
+        industry_category = _industry_category(life.get("industry", ""))
+        if industry_category:
+            candidates |= _SNS_REACTION_SETS[industry_category]
         
         # 転職回数ベースの反応（新規）
         job_change_count = life.get("job_change_count", 0)
         if job_change_count >= 4:
-            candidates.extend(SNS_REACTIONS["many_job_changes"])
+            candidates |= _SNS_REACTION_SETS["many_job_changes"]
         elif job_change_count == 0:
-            candidates.extend(SNS_REACTIONS["no_job_change"])
+            candidates |= _SNS_REACTION_SETS["no_job_change"]
         elif job_change_count <= 2:
-            candidates.extend(SNS_REACTIONS["few_job_changes"])
+            candidates |= _SNS_REACTION_SETS["few_job_changes"]
         
         # 死因ベースの反応
-        death_cause = life["death_cause"]
-        if "悪性新生物" in death_cause or "腫瘍" in death_cause or "ガン" in death_cause:
-            candidates.extend(SNS_REACTIONS["death_cancer"])
-        elif "老衰" in death_cause:
-            candidates.extend(SNS_REACTIONS["death_old_age"])
-        elif "不慮" in death_cause or "事故" in death_cause:
-            candidates.extend(SNS_REACTIONS["death_accident"])
-        elif "自殺" in death_cause or "自死" in death_cause:
-            candidates.extend(SNS_REACTIONS["death_suicide"])
+        death_category = _death_cause_category(life["death_cause"])
+        if death_category:
+            candidates |= _SNS_REACTION_SETS[death_category]
         
         # 若くして亡くなった場合
         death_age = life["death_age"]
         if death_age < 50:
-            candidates.extend(SNS_REACTIONS["death_young"])
+            candidates |= _SNS_REACTION_SETS["death_young"]
         
         # 長寿関連（新規）
         if death_age >= 90:
-            candidates.extend(SNS_REACTIONS["long_life"])
+            candidates |= _SNS_REACTION_SETS["long_life"]
         elif death_age < 65:
-            candidates.extend(SNS_REACTIONS["short_life"])
+            candidates |= _SNS_REACTION_SETS["short_life"]
         
         # 出生地ベースの反応
-        if "札幌" in life["birth_city"]:
-            candidates.extend(SNS_REACTIONS["birth_sapporo"])
-        elif "市" not in life["birth_city"]:
-            candidates.extend(SNS_REACTIONS["birth_rural"])
+        birth_city = life["birth_city"]
+        if "札幌" in birth_city:
+            candidates |= _SNS_REACTION_SETS["birth_sapporo"]
+        elif "市" not in birth_city:
+            candidates |= _SNS_REACTION_SETS["birth_rural"]
         
         # 結婚関連（新規）- lifeデータに含まれている場合
         if "married" in life:
             if life["married"]:
-                candidates.extend(SNS_REACTIONS["married"])
+                candidates |= _SNS_REACTION_SETS["married"]
             else:
-                candidates.extend(SNS_REACTIONS["unmarried"])
+                candidates |= _SNS_REACTION_SETS["unmarried"]
         
         # 汎用的な反応をランダムに追加（複数カテゴリからバランスよく）
         general_categories = ["general_cynical", "general_self_responsibility", "general_detached"]
         selected_general = random.choice(general_categories)
-        candidates.extend(SNS_REACTIONS[selected_general])
-        
-        # 重複を除去してシャッフル
-        candidates = list(set(candidates))
-        random.shuffle(candidates)
+        candidates |= _SNS_REACTION_SETS[selected_general]
         
-        # 指定数を選択
-        return candidates[:num_reactions]
+        # 指定数を選択（重複は集合の時点で除去済み。全体をシャッフルせずに必要数だけ抽出）
+        candidates = list(candidates)
+        return random.sample(candidates, min(num_reactions, len(candidates)))
@@ -7,6 +7,10 @@ Reflex版からの移植: Figmaデザイン準拠
 import streamlit as st
 import sys
 import os
+import gc
+import random
+import re
+import threading
 from pathlib import Path
 
 # プロジェクトルートをパスに追加（Streamlit Cloud対応）
@@ -17,7 +21,7 @@ if str(_project_root) not in sys.path:
 os.environ['PYTHONPATH'] = str(_project_root) + os.pathsep + os.environ.get('PYTHONPATH', '')
 
 from core import GachaService, get_gacha_service
-from src.correlation_visualizer import create_correlation_sankey, get_correlation_summary
+from src import score_points
 
 # ============================================
 # ページ設定
@@ -32,363 +36,35 @@ st.set_page_config(
 # ============================================
 # Figma準拠カスタムCSS
 # ============================================
-st.markdown("""
-<style>
-    /* Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Zen+Kaku+Gothic+New:wght@400;700&family=Zen+Old+Mincho:wght@400;700&family=Roboto:wght@400;600;700&display=swap');
-    
-    /* 全体スタイル */
-    .stApp {
-        background-color: #FFFFFF !important;
-        font-family: 'Zen Kaku Gothic New', sans-serif !important;
-    }
-    
-    /* Streamlitヘッダー・フッター非表示 */
-    header[data-testid="stHeader"] { display: none !important; }
-    footer { display: none !important; }
-    #MainMenu { display: none !important; }
-    .stDeployButton { display: none !important; }
-    
-    /* メインコンテンツ */
-    .main .block-container {
-        padding-top: 0 !important;
-        padding-bottom: 0 !important;
-        max-width: 100% !important;
-    }
-    
-    /* Streamlitデフォルトボタンを非表示 */
-    .stButton > button {
-        display: none !important;
-    }
-    
-    /* ===== ガチャ画面 ===== */
-    .gacha-container {
-        width: 100%;
-        min-height: 100vh;
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        padding: 40px 20px;
-    }
-    
-    /* 地域セレクタ - Figma準拠 */
-    .region-selector {
-        display: flex;
-        gap: 0;
-        margin-bottom: 60px;
-    }
-    .region-btn {
-        width: 300px;
-        height: 87px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-family: 'Zen Kaku Gothic New', sans-serif;
-        font-size: 24px;
-        font-weight: 400;
-        cursor: pointer;
-        transition: all 0.2s;
-        border: none;
-    }
-    .region-btn-left {
-        border-radius: 10px 0 0 10px;
-    }
-    .region-btn-right {
-        border-radius: 0 10px 10px 0;
-    }
-    .region-btn-active {
-        background: rgba(0, 0, 0, 0.1);
-        border: 1px solid rgba(0, 0, 0, 0.2);
-    }
-    .region-btn-inactive {
-        background: #D9D9D9;
-        border: 5px solid rgba(0, 0, 0, 0.2);
-    }
-    .region-btn:hover {
-        opacity: 0.8;
-    }
-    
-    /* スライダーコンテナ */
-    .slider-container {
-        width: 600px;
-        margin-bottom: 60px;
-    }
-    
-    /* ガチャボタン - Figma準拠（600x160px） */
-    .gacha-button {
-        width: 600px;
-        height: 160px;
-        background: #D9D9D9;
-        border: 5px solid #575757;
-        border-radius: 100px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-family: 'Zen Kaku Gothic New', sans-serif;
-        font-size: 36px;
-        font-weight: 700;
-        color: #323232;
-        cursor: pointer;
-        transition: all 0.2s;
-        margin-bottom: 80px;
-    }
-    .gacha-button:hover {
-        background: #CCCCCC;
-        transform: scale(1.02);
-    }
-    
-    /* 情報ボタン */
-    .info-buttons {
-        display: flex;
-        gap: 20px;
-    }
-    .info-btn {
-        width: 100px;
-        height: 28px;
-        background: #D9D9D9;
-        border: none;
-        font-family: 'Zen Kaku Gothic New', sans-serif;
-        font-size: 12px;
-        font-weight: 400;
-        color: #000000;
-        cursor: pointer;
-        transition: background 0.2s;
-    }
-    .info-btn:hover {
-        background: #CCCCCC;
-    }
-    
-    /* ===== 結果画面 ===== */
-    .result-container {
-        width: 100%;
-        min-height: 100vh;
-        position: relative;
-        padding: 76px 126px;
-    }
-    
-    /* ナビボタン */
-    .nav-btn {
-        font-family: 'Roboto', sans-serif;
-        font-weight: 600;
-        font-size: 48px;
-        color: #000000;
-        background: transparent;
-        border: none;
-        cursor: pointer;
-        transition: opacity 0.2s;
-        line-height: 1;
-    }
-    .nav-btn:hover {
-        opacity: 0.7;
-    }
-    
-    /* カードグリッド - Figma準拠（5列、gap 40px） */
-    .card-grid {
-        display: grid;
-        grid-template-columns: repeat(5, 111px);
-        gap: 40px;
-        justify-content: center;
-        margin: 40px auto;
-    }
-    
-    /* ランクカード - Figma準拠（111x148px） */
-    .rank-card {
-        width: 111px;
-        height: 148px;
-        border-radius: 8px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-family: 'Roboto', sans-serif;
-        font-weight: 600;
-        font-size: 48px;
-        cursor: pointer;
-        transition: transform 0.2s, box-shadow 0.2s;
-    }
-    .rank-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 8px 20px rgba(0, 0, 0, 0.15);
-    }
-    .rank-ss {
-        background: linear-gradient(135deg, #080808 0%, #6E6E6E 100%);
-        color: #D8D8D8;
-    }
-    .rank-s {
-        background: linear-gradient(135deg, #292929 0%, #8F8F8F 100%);
-        color: #000000;
-    }
-    .rank-other {
-        background: #D9D9D9;
-        color: #000000;
-    }
-    
-    /* カウンター */
-    .counter {
-        position: fixed;
-        bottom: 112px;
-        right: 117px;
-        font-family: 'Roboto', sans-serif;
-        font-weight: 600;
-        font-size: 20px;
-        color: #000000;
-    }
-    
-    /* ===== 詳細画面 ===== */
-    .detail-container {
-        width: 100%;
-        min-height: 100vh;
-        padding: 44px 20px;
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-    }
-    
-    /* 詳細カード - Figma準拠（1040x720px, 角丸48px） */
-    .detail-card {
-        background: #D9D9D9;
-        border-radius: 48px;
-        padding: 68px 50px 60px 50px;
-        width: 100%;
-        max-width: 1040px;
-        min-height: 720px;
-        position: relative;
-    }
-    
-    /* 人生ストーリー - Figma準拠 */
-    .life-story {
-        font-family: 'Zen Old Mincho', serif;
-        font-weight: 700;
-        font-size: 24px;
-        line-height: 2em;
-        color: #323232;
-        text-align: center;
-        white-space: pre-wrap;
-        max-width: 720px;
-        margin: 0 auto 40px auto;
-    }
-    
-    /* ランク表示 - Figma準拠（360x128px） */
-    .rank-display {
-        width: 360px;
-        height: 128px;
-        border-radius: 8px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        gap: 20px;
-        margin: 0 auto 30px auto;
-    }
-    .rank-display-ss {
-        background: linear-gradient(135deg, #080808 0%, #6E6E6E 100%);
-    }
-    .rank-display-s {
-        background: linear-gradient(135deg, #292929 0%, #8F8F8F 100%);
-    }
-    .rank-display-other {
-        background: #C0C0C0;
-    }
-    .rank-label {
-        font-family: 'Zen Old Mincho', serif;
-        font-weight: 700;
-        font-size: 36px;
-    }
-    .rank-value {
-        font-family: 'Roboto', sans-serif;
-        font-weight: 600;
-        font-size: 64px;
-    }
-    
-    /* 親ガチャランク */
-    .parent-rank {
-        text-align: center;
-        margin-bottom: 20px;
-    }
-    .parent-rank-label {
-        font-family: 'Zen Old Mincho', serif;
-        font-weight: 700;
-        font-size: 24px;
-        color: #323232;
-    }
-    .parent-rank-value {
-        font-family: 'Roboto', sans-serif;
-        font-weight: 600;
-        font-size: 40px;
-        color: #000000;
-        margin-left: 16px;
-    }
-    
-    /* 展開ボタン */
-    .expand-btn {
-        position: absolute;
-        bottom: 24px;
-        right: 40px;
-        background: transparent;
-        border: none;
-        font-size: 32px;
-        cursor: pointer;
-        color: #323232;
-        padding: 8px;
-    }
-    .expand-btn:hover {
-        opacity: 0.7;
-    }
-    
-    /* スコアセクション */
-    .score-section {
-        padding: 16px;
-        background: rgba(255,255,255,0.5);
-        border-radius: 8px;
-        margin: 8px;
-    }
-    .section-title {
-        font-family: 'Zen Kaku Gothic New', sans-serif;
-        font-weight: 700;
-        font-size: 16px;
-        color: #323232;
-        margin: 16px 0 12px 0;
-    }
-    
-    /* 閉じるボタン */
-    .close-btn {
-        position: absolute;
-        top: 44px;
-        left: 40px;
-        font-family: 'Roboto', sans-serif;
-        font-weight: 600;
-        font-size: 48px;
-        color: #000000;
-        background: transparent;
-        border: none;
-        cursor: pointer;
-        line-height: 1;
-        z-index: 10;
-    }
-    .close-btn:hover {
-        opacity: 0.7;
-    }
-</style>
-""", unsafe_allow_html=True)
+# 編集は assets/app.css で行い、scripts/minify_css.py で最小化版を生成する
+_CSS_PATH = _project_root / "assets" / "app.min.css"
+
+
+@st.cache_data(show_spinner=False)
+def _get_css() -> str:
+    """最小化済みカスタムCSSを<style>タグ付きで返す（ファイル読み込みは初回のみ）"""
+    css = _CSS_PATH.read_text(encoding="utf-8").strip()
+    return f"<style>{css}</style>"
 
 # ============================================
 # セッション状態の初期化
 # ============================================
-if 'region' not in st.session_state:
-    st.session_state.region = 'hokkaido'
-if 'num_people' not in st.session_state:
-    st.session_state.num_people = 1
-if 'view_mode' not in st.session_state:
-    st.session_state.view_mode = 'gacha'
-if 'lives' not in st.session_state:
-    st.session_state.lives = []
-if 'score_results' not in st.session_state:
-    st.session_state.score_results = []
-if 'selected_life_index' not in st.session_state:
-    st.session_state.selected_life_index = -1
-if 'total_generated' not in st.session_state:
-    st.session_state.total_generated = 0
-if 'show_detail_breakdown' not in st.session_state:
-    st.session_state.show_detail_breakdown = False
+# リスト・辞書は呼び出し可能なファクトリにしてセッションごとに新しく作る
+_SESSION_DEFAULTS = {
+    'region': 'hokkaido',
+    'num_people': 1,
+    'view_mode': 'gacha',
+    'lives': list,
+    'score_results': list,
+    'parent_results': list,
+    'selected_life_index': -1,
+    'total_generated': 0,
+    'show_detail_breakdown': False,
+    'detail_cache': dict,
+}
+for _key, _default in _SESSION_DEFAULTS.items():
+    if _key not in st.session_state:
+        st.session_state[_key] = _default() if callable(_default) else _default
 
 # ============================================
 # 定数
@@ -402,69 +78,98 @@ RANK_INFO = {
     "D": {"color": "#999999", "label": "大ハズレ", "desc": "早逝など不運な人生"},
 }
 
+# 結果カードのCSSクラス（それ以外のランクは rank-other）
+_RANK_CARD_CLASS = {"SS": "rank-ss", "S": "rank-s"}
+
+# 詳細画面のランク表示のCSSクラス（それ以外のランクは rank-display-other。文字色もCSSで指定）
+_RANK_DISPLAY_CLASS = {"SS": "rank-display rank-display-ss", "S": "rank-display rank-display-s"}
+
 GACHA_RATES = {
     "hokkaido": {"SS": "1.43%", "S": "6.01%", "A": "18.26%", "B": "46.00%", "C": "14.88%", "D": "13.42%"},
     "tokyo": {"SS": "4.33%", "S": "12.62%", "A": "25.42%", "B": "39.46%", "C": "9.31%", "D": "8.86%"},
 }
 
+# 使用データセット一覧（データセットダイアログの表）
+DATASET_ROWS = [
+    {"データ": f"{icon} {name}", "出典": source, "年": year}
+    for name, source, year, icon in (
+        ("市区町村別出生数", "厚生労働省", "2024年", "📍"),
+        ("世帯年収分布", "総務省統計局", "2023年", "💰"),
+        ("高校・大学進学率", "文部科学省", "2024年度", "🎓"),
+        ("大学進学先都道府県", "文部科学省", "2024年度", "🏫"),
+        ("最終学歴分布", "総務省統計局", "2020年", "📊"),
+        ("産業別就業者数", "総務省統計局", "2024年", "🏭"),
+        ("年齢別死亡率", "厚生労働省", "2023年", "📈"),
+        ("死因統計", "厚生労働省", "2022年", "🏥"),
+    )
+]
+
 # ============================================
 # ヘルパー関数
 # ============================================
+@st.cache_resource(show_spinner=False)
+def _service_for(region: str) -> GachaService:
+    """地域ごとのGachaServiceを返す（初回構築はセッション間で1回だけ）"""
+    return get_gacha_service(region)
+
 def get_service():
-    return get_gacha_service(st.session_state.region)
+    return _service_for(st.session_state.region)
+
+# 学歴表示の判定パターン（上から順に判定。大学院を大学より先に見る）
+_EDUCATION_DISPLAY_PATTERNS = (
+    (re.compile(r"大学院|院卒"), "院卒"),
+    (re.compile(r"大学|大卒"), "大卒"),
+    (re.compile(r"短大|専門"), "短大・専門卒"),
+    (re.compile(r"高校|高卒"), "高卒"),
+    (re.compile(r"中学|中卒"), "中学卒"),
+)
 
 def format_education_display(education: str) -> str:
     if not education or education == "不明":
         return "不明"
     education = str(education).strip()
-    if "大学院" in education or "院卒" in education:
-        return "院卒"
-    elif "大学" in education or "大卒" in education:
-        return "大卒"
-    elif "短大" in education or "専門" in education:
-        return "短大・専門卒"
-    elif "高校" in education or "高卒" in education:
-        return "高卒"
-    elif "中学" in education or "中卒" in education:
-        return "中学卒"
+    for pattern, label in _EDUCATION_DISPLAY_PATTERNS:
+        if pattern.search(education):
+            return label
     return education
 
+# ============================================
+# ボタンのコールバック
+# （描画前に状態を更新するため、クリック後に st.rerun() で描き直す必要がない）
+# ============================================
+def _set_region(region: str):
+    st.session_state.region = region
+
+def _set_view_mode(view_mode: str):
+    st.session_state.view_mode = view_mode
+
+def _open_detail(card_idx: int):
+    st.session_state.selected_life_index = card_idx
+    st.session_state.view_mode = "detail"
+    st.session_state.show_detail_breakdown = False
+
+def _toggle_detail_breakdown():
+    st.session_state.show_detail_breakdown = not st.session_state.show_detail_breakdown
+
 # ============================================
 # ガチャ画面
 # ============================================
 def gacha_view():
-    # 地域選択
+    # 地域選択（Streamlitボタンで切り替え。見た目はCSSの地域セレクタで指定）
     region = st.session_state.region
-    hokkaido_class = "region-btn region-btn-left region-btn-active" if region == "hokkaido" else "region-btn region-btn-left region-btn-inactive"
-    tokyo_class = "region-btn region-btn-right region-btn-active" if region == "tokyo" else "region-btn region-btn-right region-btn-inactive"
-    
-    st.markdown(f"""
-    <div class="gacha-container">
-        <div class="region-selector">
-            <button class="{hokkaido_class}" onclick="window.location.href='?region=hokkaido'">北海道</button>
-            <button class="{tokyo_class}" onclick="window.location.href='?region=tokyo'">東京</button>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Streamlitボタンで地域切り替え
     col1, col2, col3 = st.columns([2, 3, 2])
     with col2:
         subcol1, subcol2 = st.columns(2)
         with subcol1:
-            if st.button("北海道", key="hokkaido_btn", use_container_width=True, 
-                        type="primary" if region == "hokkaido" else "secondary"):
-                st.session_state.region = "hokkaido"
-                st.rerun()
+            st.button("北海道", key="hokkaido_btn", use_container_width=True,
+                      type="primary" if region == "hokkaido" else "secondary",
+                      on_click=_set_region, args=("hokkaido",))
         with subcol2:
-            if st.button("東京", key="tokyo_btn", use_container_width=True,
-                        type="primary" if region == "tokyo" else "secondary"):
-                st.session_state.region = "tokyo"
-                st.rerun()
-    
-    st.markdown("<br>", unsafe_allow_html=True)
+            st.button("東京", key="tokyo_btn", use_container_width=True,
+                      type="primary" if region == "tokyo" else "secondary",
+                      on_click=_set_region, args=("tokyo",))
     
-    # スライダー
+    # スライダー（上下の余白はCSSで付与）
     col1, col2, col3 = st.columns([2, 3, 2])
     with col2:
         st.session_state.num_people = st.slider(
@@ -475,8 +180,6 @@ def gacha_view():
             key="people_slider"
         )
     
-    st.markdown("<br>", unsafe_allow_html=True)
-    
     # ガチャボタン（HTMLで大きなボタン風）
     col1, col2, col3 = st.columns([2, 3, 2])
     with col2:
@@ -497,20 +200,85 @@ def gacha_view():
         if st.button("データ", key="dataset_btn"):
             show_dataset_dialog()
 
+class _GCPause:
+    """
+    一括生成中の循環GC停止（GCの有効・無効はプロセス全体で共有される）
+    
+    セッションごとのスレッドが同時に生成しても、最初に入った生成だけが止め、
+    最後に抜けた生成だけが元の状態に戻す
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+        self._was_enabled = False
+    
+    def __enter__(self):
+        with self._lock:
+            if self._active == 0:
+                self._was_enabled = gc.isenabled()
+                gc.disable()
+            self._active += 1
+        return self
+    
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self._active -= 1
+            if self._active == 0 and self._was_enabled:
+                gc.enable()
+        return False
+
+@st.cache_resource(show_spinner=False)
+def _gc_pause() -> _GCPause:
+    """全セッションで共有するGC停止のカウンター（スクリプトの再実行でも作り直さない）"""
+    return _GCPause()
+
+def _generate_batch(region: str, n: int, seed: int):
+    """
+    n人分の人生・スコア・親ガチャスコアを生成（同じ地域・人数・シードなら同じ結果になる）
+    
+    Args:
+        region: 地域識別子
+        n: 生成する人数
+        seed: 乱数シード
+    
+    Returns:
+        (人生データのリスト, スコア結果のリスト, 親ガチャスコアのリスト)
+    """
+    # セッションごとのスレッドが同時に引いても乱数列が混ざらないよう、
+    # randomモジュールではなくこの生成専用の乱数生成器を使う
+    simulator = _service_for(region).simulator.with_rng(random.Random(seed))
+    # 短命な辞書を大量に作るため、生成中は循環GCを止める
+    # （終了後に gc.collect() はしない。全体回収の方が一括生成より遅い）
+    with _gc_pause():
+        # 性別・出生地・死亡年齢などを全員分まとめて選ぶ一括生成を使う
+        lives = simulator.generate_lives(n)
+        score_results = [simulator.calculate_life_score(life) for life in lives]
+        parent_results = [simulator.calculate_parent_gacha_score(life) for life in lives]
+        # 詳細画面の親の学歴表示は生成時に一度だけ整形しておく
+        for life in lives:
+            life['father_education_display'] = format_education_display(life.get('father_education', '不明'))
+            life['mother_education_display'] = format_education_display(life.get('mother_education', '不明'))
+    return lives, score_results, parent_results
+
 def pull_gacha():
-    service = get_service()
-    st.session_state.lives = []
-    st.session_state.score_results = []
-    
-    for _ in range(st.session_state.num_people):
-        life = service.simulator.generate_life()
-        score_result = service.simulator.calculate_life_score(life)
-        st.session_state.lives.append(life)
-        st.session_state.score_results.append(score_result)
+    # 毎回新しいシードを引く（再生成でも別の結果になる）
+    st.session_state.gacha_seed = random.randrange(2**32)
+    lives, score_results, parent_results = _generate_batch(
+        st.session_state.region,
+        st.session_state.num_people,
+        st.session_state.gacha_seed,
+    )
+    st.session_state.lives = lives
+    st.session_state.score_results = score_results
+    st.session_state.parent_results = parent_results
+    st.session_state.detail_cache = {}
     
     st.session_state.total_generated += st.session_state.num_people
-    st.session_state.view_mode = "result"
-    st.rerun()
+    # 結果画面の再生成ボタンはカード描画より前にあるため、そのまま続けて描画すればよい
+    if st.session_state.view_mode != "result":
+        st.session_state.view_mode = "result"
+        st.rerun()
 
 # ============================================
 # 結果一覧画面
@@ -519,51 +287,34 @@ def result_view():
     # ヘッダー（戻る・再生成）
     col1, col2, col3 = st.columns([1, 8, 1])
     with col1:
-        if st.button("← 戻る", key="back_btn"):
-            st.session_state.view_mode = "gacha"
-            st.rerun()
+        st.button("← 戻る", key="back_btn", on_click=_set_view_mode, args=("gacha",))
     with col3:
         if st.button("↺ 再生成", key="refresh_btn"):
             pull_gacha()
     
-    st.markdown("<br>", unsafe_allow_html=True)
-    
     # カードグリッド（HTMLで表示）
     if st.session_state.score_results:
-        cards_html = '<div class="card-grid">'
+        parts = ['<br><div class="card-grid">']
         for idx, result in enumerate(st.session_state.score_results):
             rank = result.get("rank", "B")
-            if rank == "SS":
-                rank_class = "rank-ss"
-            elif rank == "S":
-                rank_class = "rank-s"
-            else:
-                rank_class = "rank-other"
-            
-            cards_html += f'<div class="rank-card {rank_class}" data-index="{idx}">{rank}</div>'
-        cards_html += '</div>'
+            rank_class = _RANK_CARD_CLASS.get(rank, "rank-other")
+            parts.append(f'<div class="rank-card {rank_class}" data-index="{idx}">{rank}</div>')
+        parts.append('</div>')
+        # 前後のスペーサーと案内文も同じ呼び出しにまとめる
+        parts.append('<br><p><strong>カードをクリックして詳細を表示:</strong></p>')
         
-        st.markdown(cards_html, unsafe_allow_html=True)
+        st.markdown("".join(parts), unsafe_allow_html=True)
         
         # Streamlitボタンで詳細画面へ
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.markdown("**カードをクリックして詳細を表示:**")
-        
-        num_results = len(st.session_state.score_results)
-        rows = (num_results + 4) // 5
         
-        for row in range(rows):
-            cols = st.columns(5)
-            for col_idx in range(5):
-                card_idx = row * 5 + col_idx
-                if card_idx < num_results:
-                    rank = st.session_state.score_results[card_idx].get("rank", "B")
-                    with cols[col_idx]:
-                        if st.button(f"{rank}", key=f"detail_{card_idx}", use_container_width=True):
-                            st.session_state.selected_life_index = card_idx
-                            st.session_state.view_mode = "detail"
-                            st.session_state.show_detail_breakdown = False
-                            st.rerun()
+        # 列を一度だけ作り、card_idx 番目を card_idx % 5 列目に積む
+        # （ボタンの高さは揃っているので、行ごとに列を作るのと同じ並びになる）
+        cols = st.columns(5)
+        for card_idx, result in enumerate(st.session_state.score_results):
+            rank = result.get("rank", "B")
+            with cols[card_idx % 5]:
+                st.button(f"{rank}", key=f"detail_{card_idx}", use_container_width=True,
+                          on_click=_open_detail, args=(card_idx,))
     
     # カウンター
     st.markdown(f'<div class="counter">{st.session_state.total_generated}</div>', unsafe_allow_html=True)
@@ -580,32 +331,23 @@ def detail_view():
     service = get_service()
     life = st.session_state.lives[st.session_state.selected_life_index]
     score_result = st.session_state.score_results[st.session_state.selected_life_index]
+    parent_result = st.session_state.parent_results[st.session_state.selected_life_index]
     
     # 閉じるボタン
-    if st.button("× 閉じる", key="close_btn"):
-        st.session_state.view_mode = "result"
-        st.rerun()
+    st.button("× 閉じる", key="close_btn", on_click=_set_view_mode, args=("result",))
     
-    # 人生ストーリー
-    life_story = service._generate_life_story(life)
+    # 人生ストーリー（展開ボタンでの再実行では作り直さない）
+    life_story = st.session_state.detail_cache.get(st.session_state.selected_life_index)
+    if life_story is None:
+        life_story = st.session_state.detail_cache[st.session_state.selected_life_index] = (
+            service._generate_life_story(life, score_result)
+        )
     
     # ランク情報
     rank = score_result.get("rank", "B")
-    total_score = int(score_result.get("total_score", 0))
-    rank_label = score_result.get("rank_label", "")
-    
-    if rank == "SS":
-        rank_display_class = "rank-display rank-display-ss"
-        rank_color = "#D8D8D8"
-    elif rank == "S":
-        rank_display_class = "rank-display rank-display-s"
-        rank_color = "#000000"
-    else:
-        rank_display_class = "rank-display rank-display-other"
-        rank_color = "#000000"
+    rank_display_class = _RANK_DISPLAY_CLASS.get(rank, "rank-display rank-display-other")
     
     # 親ガチャ
-    parent_result = service.simulator.calculate_parent_gacha_score(life)
     parent_rank = parent_result.get("rank", "B")
     
     # 詳細カードHTML
@@ -614,8 +356,8 @@ def detail_view():
         <div class="life-story">{life_story}</div>
         
         <div class="{rank_display_class}">
-            <span class="rank-label" style="color: {rank_color};">人生ランク</span>
-            <span class="rank-value" style="color: {rank_color};">{rank}</span>
+            <span class="rank-label">人生ランク</span>
+            <span class="rank-value">{rank}</span>
         </div>
         
         <div class="parent-rank">
@@ -625,127 +367,117 @@ def detail_view():
     </div>
     """, unsafe_allow_html=True)
     
-    # 展開ボタン
+    _breakdown_section(life, score_result, parent_result)
+
+@st.fragment
+def _breakdown_section(life: dict, score_result: dict, parent_result: dict):
+    # 展開ボタンを押しても、この部分だけを再実行する（ストーリーやランク表示は描き直さない）
     expand_label = "↑ 閉じる" if st.session_state.show_detail_breakdown else "↓ 詳細を展開"
-    if st.button(expand_label, key="expand_btn"):
-        st.session_state.show_detail_breakdown = not st.session_state.show_detail_breakdown
-        st.rerun()
+    st.button(expand_label, key="expand_btn", on_click=_toggle_detail_breakdown)
     
     # 詳細展開
     if st.session_state.show_detail_breakdown:
         show_detail_breakdown(life, score_result, parent_result)
 
+def _score_markdown(title: str, item: dict) -> str:
+    """スコア内訳1項目分（見出し・スコア・値）のMarkdownを作成"""
+    return f"**{title}**\n\nスコア: {item.get('score', 0):.1f}点\n\n→ {item.get('value', '')}"
+
+def _three_col(left: str, center: str, right: str):
+    """3列を作り、各列にMarkdownを1つずつ描画"""
+    col1, col2, col3 = st.columns(3)
+    col1.markdown(left)
+    col2.markdown(center)
+    col3.markdown(right)
+
 def show_detail_breakdown(life: dict, score_result: dict, parent_result: dict):
+    # 各列の内容を先に組み立て、列ごとに1つのMarkdownとして描画する（段落区切りで1行ずつ表示）
     st.markdown("---")
     
-    total_score = int(score_result.get("total_score", 0))
+    total_score = score_points(score_result.get("total_score", 0))
     rank_label = score_result.get("rank_label", "")
     st.markdown(f"### {total_score}点「{rank_label}」")
     
     # 詳細データ
     st.markdown("#### 📋 詳細データ")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("**👶 出生情報**")
-        gender = "男性" if life.get('gender') == 'male' else "女性"
-        st.write(f"性別: {gender}")
-        st.write(f"出生地: {life.get('birth_city', '不明')}")
-        st.write(f"世帯年収: {life.get('household_income', '不明')}")
-        st.write(f"父学歴: {format_education_display(life.get('father_education', '不明'))}")
-        st.write(f"母学歴: {format_education_display(life.get('mother_education', '不明'))}")
+    gender = "男性" if life.get('gender') == 'male' else "女性"
+    birth_lines = [
+        "**👶 出生情報**",
+        f"性別: {gender}",
+        f"出生地: {life.get('birth_city', '不明')}",
+        f"世帯年収: {life.get('household_income', '不明')}",
+        f"父学歴: {life['father_education_display']}",
+        f"母学歴: {life['mother_education_display']}",
+    ]
     
-    with col2:
-        st.markdown("**📚 学歴・偏差値**")
-        deviation_value = life.get('deviation_value', 0)
-        if deviation_value:
-            st.write(f"個人偏差値: {deviation_value:.1f}")
-        
-        if life.get('high_school'):
-            hs_name = life.get('high_school_name', '')
-            if isinstance(hs_name, dict):
-                hs_name = hs_name.get('name', '')
-            hs_deviation = life.get('high_school_deviation', 0)
-            if hs_deviation:
-                st.write(f"高校: {hs_name} (偏差値{hs_deviation:.1f})")
-            else:
-                st.write(f"高校: {hs_name or '進学'}")
+    education_lines = ["**📚 学歴・偏差値**"]
+    deviation_value = life.get('deviation_value', 0)
+    if deviation_value:
+        education_lines.append(f"個人偏差値: {deviation_value:.1f}")
+    
+    if life.get('high_school'):
+        hs_name = life.get('high_school_name', '')
+        if isinstance(hs_name, dict):
+            hs_name = hs_name.get('name', '')
+        hs_deviation = life.get('high_school_deviation', 0)
+        if hs_deviation:
+            education_lines.append(f"高校: {hs_name} (偏差値{hs_deviation:.1f})")
         else:
-            st.write("高校: 進学せず")
-        
-        graduation_deviation = life.get('graduation_deviation', 0)
-        if graduation_deviation and deviation_value:
-            growth = graduation_deviation - deviation_value
-            growth_str = f"+{growth:.1f}" if growth >= 0 else f"{growth:.1f}"
-            st.write(f"卒業時偏差値: {graduation_deviation:.1f} ({growth_str})")
-        
-        if life.get('university'):
-            uni_name = life.get('university_name', '')
-            if isinstance(uni_name, dict):
-                uni_name = uni_name.get('name', '')
-            st.write(f"大学: {uni_name}")
-            st.write(f"大学ランク: {life.get('university_rank', '')}")
-        else:
-            st.write("大学: 進学せず")
-    
-    with col3:
-        st.markdown("**💼 キャリア**")
-        st.write(f"企業規模: {life.get('company_size', '不明')}")
-        st.write(f"雇用形態: {life.get('employment_type', '不明')}")
-        career_summary = life.get('career_summary', {})
-        st.write(f"転職回数: {career_summary.get('total_job_changes', 0)}回")
-        st.write(f"死亡年齢: {life.get('death_age', 0)}歳")
-        st.write(f"死因: {life.get('death_cause', '不明')}")
+            education_lines.append(f"高校: {hs_name or '進学'}")
+    else:
+        education_lines.append("高校: 進学せず")
+    
+    graduation_deviation = life.get('graduation_deviation', 0)
+    if graduation_deviation and deviation_value:
+        growth = graduation_deviation - deviation_value
+        growth_str = f"+{growth:.1f}" if growth >= 0 else f"{growth:.1f}"
+        education_lines.append(f"卒業時偏差値: {graduation_deviation:.1f} ({growth_str})")
+    
+    if life.get('university'):
+        uni_name = life.get('university_name', '')
+        if isinstance(uni_name, dict):
+            uni_name = uni_name.get('name', '')
+        education_lines.append(f"大学: {uni_name}")
+        education_lines.append(f"大学ランク: {life.get('university_rank', '')}")
+    else:
+        education_lines.append("大学: 進学せず")
+    
+    career_summary = life.get('career_summary', {})
+    career_lines = [
+        "**💼 キャリア**",
+        f"企業規模: {life.get('company_size', '不明')}",
+        f"雇用形態: {life.get('employment_type', '不明')}",
+        f"転職回数: {career_summary.get('total_job_changes', 0)}回",
+        f"死亡年齢: {life.get('death_age', 0)}歳",
+        f"死因: {life.get('death_cause', '不明')}",
+    ]
+    _three_col(
+        "\n\n".join(birth_lines),
+        "\n\n".join(education_lines),
+        "\n\n".join(career_lines),
+    )
     
     # 人生スコア内訳
     st.markdown("#### 📈 人生スコア内訳")
     breakdown = score_result.get('breakdown', {})
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        lifespan = breakdown.get('lifespan', {})
-        st.markdown("**寿命 (40%)**")
-        st.write(f"スコア: {lifespan.get('score', 0):.1f}点")
-        st.write(f"→ {lifespan.get('value', '')}")
-    
-    with col2:
-        income = breakdown.get('lifetime_income', {})
-        st.markdown("**生涯年収 (35%)**")
-        st.write(f"スコア: {income.get('score', 0):.1f}点")
-        st.write(f"→ {income.get('value', '')}")
-    
-    with col3:
-        edu = breakdown.get('education', {})
-        st.markdown("**学歴 (25%)**")
-        st.write(f"スコア: {edu.get('score', 0):.1f}点")
-        st.write(f"→ {edu.get('value', '')}")
+    _three_col(
+        _score_markdown("寿命 (40%)", breakdown.get('lifespan', {})),
+        _score_markdown("生涯年収 (35%)", breakdown.get('lifetime_income', {})),
+        _score_markdown("学歴 (25%)", breakdown.get('education', {})),
+    )
     
     # 親ガチャスコア内訳
     st.markdown("#### 📈 親ガチャスコア内訳")
-    parent_total = int(parent_result.get('total_score', 0))
+    parent_total = score_points(parent_result.get('total_score', 0))
     parent_rank_label = parent_result.get('rank_label', '')
     st.markdown(f"**親ガチャ: {parent_total}点「{parent_rank_label}」**")
     
     p_breakdown = parent_result.get('breakdown', {})
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        p_income = p_breakdown.get('household_income', {})
-        st.markdown("**世帯年収 (35%)**")
-        st.write(f"スコア: {p_income.get('score', 0):.1f}点")
-        st.write(f"→ {p_income.get('value', '')}")
-    
-    with col2:
-        p_birth = p_breakdown.get('birthplace', {})
-        st.markdown("**出生地 (35%)**")
-        st.write(f"スコア: {p_birth.get('score', 0):.1f}点")
-        st.write(f"→ {p_birth.get('value', '')}")
-    
-    with col3:
-        p_edu = p_breakdown.get('parent_education', {})
-        st.markdown("**親の学歴 (30%)**")
-        st.write(f"スコア: {p_edu.get('score', 0):.1f}点")
-        st.write(f"→ {p_edu.get('value', '')}")
+    _three_col(
+        _score_markdown("世帯年収 (35%)", p_breakdown.get('household_income', {})),
+        _score_markdown("出生地 (35%)", p_breakdown.get('birthplace', {})),
+        _score_markdown("親の学歴 (30%)", p_breakdown.get('parent_education', {})),
+    )
 
 # ============================================
 # ダイアログ
@@ -758,24 +490,30 @@ def show_rates_dialog():
     st.markdown(f"**{region_name}のガチャ確率**（10,000回シミュレーション）")
     st.markdown("---")
     
-    for rank, rate in rates.items():
-        info = RANK_INFO[rank]
-        col1, col2, col3 = st.columns([1, 3, 1])
-        with col1:
-            st.markdown(f"**{rank}**")
-        with col2:
-            st.write(f"{info['label']} - {info['desc']}")
-        with col3:
-            st.write(f"**{rate}**")
+    # ランクごとに列を並べず、1つの表としてまとめて描画する
+    rows = [
+        {
+            "ランク": rank,
+            "内容": f"{RANK_INFO[rank]['label']} - {RANK_INFO[rank]['desc']}",
+            "確率": rate,
+        }
+        for rank, rate in rates.items()
+    ]
+    st.dataframe(rows, hide_index=True, use_container_width=True)
     
     st.caption("確率は2026年1月計算（寿命40%・生涯年収35%・学歴25%）に基づきます。")
 
+@st.cache_resource(show_spinner=False)
+def _get_correlation_data():
+    """相関図とサマリーを返す（plotlyは初めて相関図を開いたときに読み込む）"""
+    from src.correlation_visualizer import create_correlation_sankey, get_correlation_summary
+    return create_correlation_sankey(), get_correlation_summary()
+
 @st.dialog("📊 相関図", width="large")
 def show_correlation_dialog():
     try:
-        fig = create_correlation_sankey()
+        fig, summary = _get_correlation_data()
         st.plotly_chart(fig, use_container_width=True)
-        summary = get_correlation_summary()
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("ノード数", summary.get('nodes', 0))
@@ -789,23 +527,15 @@ def show_correlation_dialog():
 @st.dialog("📋 データセット", width="large")
 def show_dataset_dialog():
     st.markdown("### 使用データセット")
-    datasets = [
-        {"name": "市区町村別出生数", "source": "厚生労働省", "year": "2024年", "icon": "📍"},
-        {"name": "世帯年収分布", "source": "総務省統計局", "year": "2023年", "icon": "💰"},
-        {"name": "高校・大学進学率", "source": "文部科学省", "year": "2024年度", "icon": "🎓"},
-        {"name": "大学進学先都道府県", "source": "文部科学省", "year": "2024年度", "icon": "🏫"},
-        {"name": "最終学歴分布", "source": "総務省統計局", "year": "2020年", "icon": "📊"},
-        {"name": "産業別就業者数", "source": "総務省統計局", "year": "2024年", "icon": "🏭"},
-        {"name": "年齢別死亡率", "source": "厚生労働省", "year": "2023年", "icon": "📈"},
-        {"name": "死因統計", "source": "厚生労働省", "year": "2022年", "icon": "🏥"},
-    ]
-    for ds in datasets:
-        st.write(f"{ds['icon']} **{ds['name']}** - {ds['source']} ({ds['year']})")
+    st.dataframe(DATASET_ROWS, hide_index=True, use_container_width=True)
 
 # ============================================
 # メイン
 # ============================================
 def main():
+    # Streamlitは再実行ごとに要素を描き直すため、CSSも毎回注入する必要がある
+    st.markdown(_get_css(), unsafe_allow_html=True)
+    
     if st.session_state.view_mode == "gacha":
         gacha_view()
     elif st.session_state.view_mode == "result":